@@ -123,12 +123,20 @@ class ValidationRule(object):
         # This indicates whether the user checked the manual rule as being "done"
         self._manual_checked = False
 
+        # The actions do not change, check once if there are any
+        self._has_actions = bool(self._data.get("actions"))
+
+        # Optional and manual rules display a check box, check once since the rule data does not change
+        self._has_checkbox_slot = self.optional or self.manual
+
         # Get the validatin rule type object for this rule
         self._rule_type = ValidationRuleType.get_type_for_rule(self)
 
         # Initialize valid property to None, indicating that this rule has not been checked yet.
         # Set to True once check has been run and the rule fails, or False if it passes.
         self._valid = None
+        # The check name to display once the rule has been checked, computed on first access
+        self._revalidate_name = None
         # The error items found the last time the rule's check function was executed.
         self._error_items = None
         self._error_count = 0
@@ -217,6 +225,23 @@ class ValidationRule(object):
         """Get the display name for the check function of this rule."""
         return self._data.get("check_name", "Validate")
 
+    @property
+    def display_check_name(self):
+        """
+        Get the display name for the check function of this rule, based on whether it has been executed.
+
+        Once the check function has been executed, the check name is prefixed with "Re", e.g.
+        Validate -> Revalidate.
+        """
+
+        name = self.check_name
+        if not name or self._valid is None:
+            return name
+
+        if self._revalidate_name is None:
+            self._revalidate_name = "Re{name}".format(name=name.lower())
+        return self._revalidate_name
+
     @property
     def fix_name(self):
         """Get the display name for the fix function of this rule."""
@@ -244,6 +269,15 @@ class ValidationRule(object):
         """Get or set the text that describes the current warnings."""
         return self._data.get("warn_msg")
 
+    @property
+    def has_checkbox_slot(self):
+        """
+        Get the property flag indicating if this rule is optional or manual.
+
+        These rules display a check box, or a placeholder to align the check boxes of other rules.
+        """
+        return self._has_checkbox_slot
+
     @property
     def checked(self):
         """
@@ -295,7 +329,8 @@ class ValidationRule(object):
     @property
     def get_kwargs(self):
         """Get the function that returns the extra keyword arguments dict to pass to the check and fix functions."""
-        return self._data.get("get_kwargs", lambda: {})
+        # The dict type returns a new empty dict when called, without creating a function on each access
+        return self._data.get("get_kwargs", dict)
 
     @property
     def actions(self):
@@ -307,6 +342,11 @@ class ValidationRule(object):
         """
         return self._data.get("actions", [])
 
+    @property
+    def has_actions(self):
+        """Get the property flag indicating if this rule has any actions."""
+        return self._has_actions
+
     @property
     def item_actions(self):
         """
@@ -394,12 +434,16 @@ class ValidationRule(object):
         :rtype: List[dict]
         """
 
+        if not self.actions:
+            return []
+
+        # Get the current errors once, so that the action functions can be applied to the current
+        # errors. The check function is not re-run for each action.
+        errors = self.get_errors() if pre_validate else self.errors
+
         actions = []
 
         for action in self.actions:
-            # Add the current errors to the action data so that the action function can be
-            # applied to the current errors.
-            errors = self.get_errors() if pre_validate else self.errors
             action["kwargs"] = {"errors": errors}
             actions.append(action)
 
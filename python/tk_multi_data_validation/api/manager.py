@@ -481,7 +481,7 @@ class ValidationManager(object):
 
         self._logger.debug(
             "\nResolving Rule: {}\nDependencies: {}".format(
-                rule.id, ", ".join([d for d in rule.get_dependency_names()])
+                rule.id, ", ".join(rule.get_dependency_names())
             )
         )
 
@@ -27,8 +27,22 @@ class ValidationRuleDetailsModel(QtGui.QStandardItemModel, ViewItemRolesMixin):
         FOOTER_TEXT_ROLE,
         DETAILS_ITEM_ID_ROLE,
         DISPLAY_NUM_ROLE,
+        ACTION_BUTTON_DATA_ROLE,
+        SHOW_MORE_DATA_ROLE,
+        ITEM_LAYOUT_ROLE,
         NEXT_AVAILABLE_ROLE,  # Keep track of the next available custome role. Insert new roles above.
-    ) = range(_BASE_ROLE, _BASE_ROLE + 6)
+    ) = range(_BASE_ROLE, _BASE_ROLE + 9)
+
+    # The item layout types, returned by the ITEM_LAYOUT_ROLE
+    (
+        LAYOUT_GROUP,
+        LAYOUT_ITEM,
+        LAYOUT_FOOTER,
+    ) = range(3)
+
+    # The action data returned for items that do not display the action
+    HIDDEN_ACTION_BUTTON_DATA = {"visible": False, "name": ""}
+    HIDDEN_SHOW_MORE_DATA = {"visible": False, "name": "", "width": "100%"}
 
     # The max number of items the model can display at a time. TODO handle large data sets with pagination
     MAX_DISPLAY_NUM = 150
@@ -53,6 +67,11 @@ class ValidationRuleDetailsModel(QtGui.QStandardItemModel, ViewItemRolesMixin):
 
             self._text = text
 
+        @property
+        def action_button_data(self):
+            """Get the data for the action button, group items do not display an action."""
+            return ValidationRuleDetailsModel.HIDDEN_ACTION_BUTTON_DATA
+
         def data(self, role):
             """
             Override the base class method.
@@ -79,15 +98,22 @@ class ValidationRuleDetailsModel(QtGui.QStandardItemModel, ViewItemRolesMixin):
                 num_display = self.model().display_num
                 num_total = len(self.model().details_items)
                 if num_display < num_total:
-                    return "SHOWING {displaying} OF {total}".format(
-                        displaying=num_display, total=num_total
-                    )
+                    return f"SHOWING {num_display} OF {num_total}"
 
-                return "{} Items".format(num_total)
+                return f"{num_total} Items"
 
             if role == ValidationRuleDetailsModel.VIEW_ITEM_SEPARATOR_ROLE:
                 return True
 
+            if role == ValidationRuleDetailsModel.ACTION_BUTTON_DATA_ROLE:
+                return self.action_button_data
+
+            if role == ValidationRuleDetailsModel.SHOW_MORE_DATA_ROLE:
+                return ValidationRuleDetailsModel.HIDDEN_SHOW_MORE_DATA
+
+            if role == ValidationRuleDetailsModel.ITEM_LAYOUT_ROLE:
+                return ValidationRuleDetailsModel.LAYOUT_GROUP
+
             return super(
                 ValidationRuleDetailsModel.ValidationRuleDetailsGroupModelItem, self
             ).data(role)
@@ -124,6 +150,24 @@ class ValidationRuleDetailsModel(QtGui.QStandardItemModel, ViewItemRolesMixin):
 
             self._details = details
             self._is_footer = is_footer
+            self._action_button_data = None
+
+        @property
+        def action_button_data(self):
+            """
+            Get the data for the action button displayed by this item.
+
+            The data is computed once, the model recreates its items when the action changes.
+            """
+
+            if self._action_button_data is None:
+                if self._is_footer or not self._details.get("id") or not self.model():
+                    self._action_button_data = (
+                        ValidationRuleDetailsModel.HIDDEN_ACTION_BUTTON_DATA
+                    )
+                else:
+                    self._action_button_data = self.model().action_button_data
+            return self._action_button_data
 
         def data(self, role):
             """
@@ -166,6 +210,19 @@ class ValidationRuleDetailsModel(QtGui.QStandardItemModel, ViewItemRolesMixin):
             if role == ValidationRuleDetailsModel.DISPLAY_NUM_ROLE:
                 return self._display_num
 
+            if role == ValidationRuleDetailsModel.ACTION_BUTTON_DATA_ROLE:
+                return self.action_button_data
+
+            if role == ValidationRuleDetailsModel.SHOW_MORE_DATA_ROLE:
+                if self._is_footer:
+                    return self.model().show_more_data
+                return ValidationRuleDetailsModel.HIDDEN_SHOW_MORE_DATA
+
+            if role == ValidationRuleDetailsModel.ITEM_LAYOUT_ROLE:
+                if self._is_footer:
+                    return ValidationRuleDetailsModel.LAYOUT_FOOTER
+                return ValidationRuleDetailsModel.LAYOUT_ITEM
+
             return super(
                 ValidationRuleDetailsModel.ValidationRuleDetailsModelItem, self
             ).data(role)
@@ -212,6 +269,11 @@ class ValidationRuleDetailsModel(QtGui.QStandardItemModel, ViewItemRolesMixin):
 
         self._details_items = []
         self._display_num = self.MAX_DISPLAY_NUM
+        self._item_action_name = None
+
+        # The action data displayed by the items, computed when the model data changes
+        self._action_button_data = self.HIDDEN_ACTION_BUTTON_DATA
+        self._show_more_data = self.HIDDEN_SHOW_MORE_DATA
 
         # Add additional roles defined by the ViewItemRolesMixin class.
         self.NEXT_AVAILABLE_ROLE = self.initialize_roles(self.NEXT_AVAILABLE_ROLE)
@@ -230,6 +292,16 @@ class ValidationRuleDetailsModel(QtGui.QStandardItemModel, ViewItemRolesMixin):
         """Get the maximum number of items the model will show."""
         return self._display_num
 
+    @property
+    def action_button_data(self):
+        """Get the data for the action button displayed by each details item."""
+        return self._action_button_data
+
+    @property
+    def show_more_data(self):
+        """Get the data for the show more/less action displayed by the footer item."""
+        return self._show_more_data
+
     ######################################################################################################
     # Public methods
     #
@@ -254,42 +326,69 @@ class ValidationRuleDetailsModel(QtGui.QStandardItemModel, ViewItemRolesMixin):
 
         super().clear()
 
-    def initialize_data(self, data=None, display_num=None):
+    def initialize_data(self, data=None, display_num=None, item_action_name=None):
         """
         Initialize the model with the set of details items for the given validation rule.
 
         The model will be cleared, all items removed, and new model items added for the details item.
 
+        Model items are only created for the details items displayed, at most `display_num`, so the cost
+        of initializing the model does not grow with the size of the data. The remaining items are
+        created when more items are requested, see `toggle_display_items`.
+
         :param data: The data to initialize the model with.
         :type data: list<dict>
+        :param display_num: The number of items to display.
+        :type display_num: int
+        :param item_action_name: The name of the action button to display for each item. If no data
+            is given, the current action name is kept.
+        :type item_action_name: str
         """
 
         self.beginResetModel()
 
         if data is None:
             data = self._details_items
+            item_action_name = self._item_action_name
 
-        self.clear()
-        self._details_items = data
-        self._display_num = display_num or self.MAX_DISPLAY_NUM
+        self._item_action_name = item_action_name
+        if item_action_name:
+            self._action_button_data = {"visible": True, "name": item_action_name}
+        else:
+            self._action_button_data = self.HIDDEN_ACTION_BUTTON_DATA
+
+        # Block signals while clearing and adding the items, so that views only receive the single
+        # model reset signal emitted at the end, instead of one signal per item.
+        restore_state = self.blockSignals(True)
+        try:
+            self.clear()
+            self._details_items = data
+            self._display_num = display_num or self.MAX_DISPLAY_NUM
+
+            group_item = ValidationRuleDetailsModel.ValidationRuleDetailsGroupModelItem(
+                "Affected Objects"
+            )
+            self.invisibleRootItem().appendRow(group_item)
 
-        group_item = ValidationRuleDetailsModel.ValidationRuleDetailsGroupModelItem(
-            "Affected Objects"
-        )
-        self.invisibleRootItem().appendRow(group_item)
+            # Create all the items first and add them in a single call
+            model_items = [
+                ValidationRuleDetailsModel.ValidationRuleDetailsModelItem(item_data)
+                for item_data in self._details_items[: self._display_num]
+            ]
 
-        for item_data in self._details_items[: self._display_num]:
-            model_item = ValidationRuleDetailsModel.ValidationRuleDetailsModelItem(
-                item_data
-            )
-            group_item.appendRow(model_item)
+            num_items = len(self._details_items)
+            if num_items > self._display_num or num_items > self.MAX_DISPLAY_NUM:
+                model_items.append(
+                    ValidationRuleDetailsModel.ValidationRuleDetailsModelItem(
+                        {}, is_footer=True
+                    )
+                )
 
-        num_items = len(self._details_items)
-        if num_items > self._display_num or num_items > self.MAX_DISPLAY_NUM:
-            footer_item = ValidationRuleDetailsModel.ValidationRuleDetailsModelItem(
-                {}, is_footer=True
-            )
-            group_item.appendRow(footer_item)
+            group_item.appendRows(model_items)
+
+            self._update_show_more_data()
+        finally:
+            self.blockSignals(restore_state)
 
         self.endResetModel()
 
@@ -329,19 +428,23 @@ class ValidationRuleDetailsModel(QtGui.QStandardItemModel, ViewItemRolesMixin):
                     {}, is_footer=True
                 )
 
-            # Add the new items
-            for item_data in self._details_items[self._display_num : new_display_num]:
-                model_item = ValidationRuleDetailsModel.ValidationRuleDetailsModelItem(
-                    item_data
-                )
-                group_item.appendRow(model_item)
+            # Add the new items, and the footer, in a single call
+            model_items = [
+                ValidationRuleDetailsModel.ValidationRuleDetailsModelItem(item_data)
+                for item_data in self._details_items[
+                    self._display_num : new_display_num
+                ]
+            ]
 
             num_items = len(self._details_items)
             if num_items > new_display_num or num_items > self.MAX_DISPLAY_NUM:
-                group_item.appendRow(footer_item)
+                model_items.append(footer_item)
+
+            group_item.appendRows(model_items)
 
             # Update the display number
             self._display_num = new_display_num
+            self._update_show_more_data()
 
         else:
             # Show less (revert to original max number of items)
@@ -367,3 +470,18 @@ class ValidationRuleDetailsModel(QtGui.QStandardItemModel, ViewItemRolesMixin):
 
         # Else, items exceeded the max but now are all showing.
         return "Show Less..."
+
+    ######################################################################################################
+    # Protected methods
+    #
+
+    def _update_show_more_data(self):
+        """
+        Update the data for the footer item show more/less action.
+        """
+
+        self._show_more_data = {
+            "visible": True,
+            "name": self.get_footer_text(),
+            "width": "100%",
+        }
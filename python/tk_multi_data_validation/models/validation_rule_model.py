@@ -46,8 +46,11 @@ class ValidationRuleModel(QtGui.QStandardItemModel, ViewItemRolesMixin):
         RULE_ERROR_ITEMS_ROLE,  # The data that is found to have validation errors
         RULE_MANUAL_CHECK_STATE_ROLE,  # True if the rule is a manual check
         RULE_STATUS_ICON_ROLE,  # The status icon for the current state of the rule
+        RULE_CALLABLE_ACTIONS_ROLE,  # The rule actions that have a callback to execute
+        RULE_HAS_ACTIONS_ROLE,  # True if the rule has action items
+        RULE_HAS_ITEMS_ROLE,  # True if the group item has rule items
         NEXT_AVAILABLE_ROLE,  # Keep track of the next available custome role. Insert new roles above.
-    ) = range(_BASE_ROLE, _BASE_ROLE + 22)
+    ) = range(_BASE_ROLE, _BASE_ROLE + 25)
 
     #
     # Signals
@@ -139,6 +142,10 @@ class ValidationRuleModel(QtGui.QStandardItemModel, ViewItemRolesMixin):
             if role == ValidationRuleModel.RULE_ITEMS_ROLE:
                 return self._get_rules()
 
+            if role == ValidationRuleModel.RULE_HAS_ITEMS_ROLE:
+                # Avoid building the list of rules to check if there are any
+                return self.rowCount() > 0
+
             if role == ValidationRuleModel.RULE_CHECK_NAME_ROLE:
                 return "Validate {}".format(self._name)
 
@@ -233,6 +240,9 @@ class ValidationRuleModel(QtGui.QStandardItemModel, ViewItemRolesMixin):
                         SGQIcon, self._rule.type.sg_checkbox_icon
                     )()
 
+            # The rule actions that have a callback, filtered once when first requested
+            self._callable_actions = None
+
             # UI properties
             self._is_loading = False
 
@@ -441,6 +451,20 @@ class ValidationRuleModel(QtGui.QStandardItemModel, ViewItemRolesMixin):
                     return None
                 return self._rule.get_actions_data()
 
+            if role == ValidationRuleModel.RULE_HAS_ACTIONS_ROLE:
+                if not self._rule:
+                    return False
+                return self._rule.has_actions
+
+            if role == ValidationRuleModel.RULE_CALLABLE_ACTIONS_ROLE:
+                if not self._rule:
+                    return None
+                if self._callable_actions is None:
+                    self._callable_actions = [
+                        a for a in self._rule.actions if a.get("callback")
+                    ]
+                return self._callable_actions
+
             if role == ValidationRuleModel.RULE_MANUAL_CHECK_STATE_ROLE:
                 if not self._rule:
                     return None
@@ -481,6 +505,7 @@ class ValidationRuleModel(QtGui.QStandardItemModel, ViewItemRolesMixin):
 
             if role == ValidationRuleModel.RULE_ITEM_ROLE:
                 self._rule = value
+                self._callable_actions = None
                 self.emitDataChanged()
 
             elif role == ValidationRuleModel.VIEW_ITEM_LOADING_ROLE:
@@ -670,6 +695,37 @@ class ValidationRuleModel(QtGui.QStandardItemModel, ViewItemRolesMixin):
 
         self.endResetModel()
 
+    def emit_rule_state_changed(self, model_item):
+        """
+        Emit the data changed signal for the rule model item roles that depend on the rule validation state.
+
+        Unlike the model item `emitDataChanged`, the signal specifies the changed roles, such that listeners
+        can ignore the roles that have not changed after validating or fixing the rule. The roles with a
+        data method set up in `role_methods` are always included, since the hook methods may depend on the
+        rule validation state.
+
+        :param model_item: The rule model item whose rule has been validated or fixed.
+        :type model_item: ValidationRuleModel.ValidationRuleModelItem
+        """
+
+        roles = [
+            self.RULE_VALIDATION_RAN,
+            self.RULE_FIX_RAN,
+            self.RULE_VALID_ROLE,
+            self.RULE_HAS_ERROR_ROLE,
+            self.RULE_ACTIONS_ROLE,
+            self.RULE_ERROR_ITEMS_ROLE,
+            self.RULE_MANUAL_CHECK_STATE_ROLE,
+            self.RULE_STATUS_ICON_ROLE,
+            self.VIEW_ITEM_TEXT_ROLE,
+            QtCore.Qt.BackgroundRole,
+            QtCore.Qt.CheckStateRole,
+        ]
+        roles.extend(role for role in self.role_methods if role not in roles)
+
+        index = model_item.index()
+        self.dataChanged.emit(index, index, roles)
+
     def emit_all_data_changed(self):
         """
         Emit the data changed signal for each item in the model.
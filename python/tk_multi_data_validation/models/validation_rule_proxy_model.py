@@ -10,6 +10,7 @@
 
 from .validation_rule_model import ValidationRuleModel
 from ..utils.framework_qtwidgets import FilterItem, FilterItemTreeProxyModel
+from ..utils.model_signals import connect_model_changed, disconnect_model_changed
 
 
 class ValidationRuleProxyModel(FilterItemTreeProxyModel):
@@ -34,6 +35,10 @@ class ValidationRuleProxyModel(FilterItemTreeProxyModel):
         # check acceptance
         #
         self._text_filter = None
+        # The text filter data function and its cached data per source index. The data is cached until the
+        # source model data changes, such that editing the filter text does not recompute the data
+        self._text_filter_data_func = None
+        self._text_filter_data_cache = {}
         self._rule_type_filter = None
         self._rule_type_filter_role = None
 
@@ -61,16 +66,21 @@ class ValidationRuleProxyModel(FilterItemTreeProxyModel):
         :type data_func: function
         """
 
+        if data_func != self._text_filter_data_func:
+            self._text_filter_data_func = data_func
+            self._text_filter_data_cache.clear()
+        cached_data_func = self._get_text_filter_data if data_func else None
+
         if self._text_filter:
             self._text_filter.filter_role = filter_role
-            self._text_filter.data_func = data_func
+            self._text_filter.data_func = cached_data_func
         else:
             self._text_filter = FilterItem(
                 None,  # id field is not necessary
                 FilterItem.FilterType.STR,
                 FilterItem.FilterOp.IN,
                 filter_role=filter_role,
-                data_func=data_func,
+                data_func=cached_data_func,
             )
 
         self._text_filter.filter_value = text
@@ -86,6 +96,13 @@ class ValidationRuleProxyModel(FilterItemTreeProxyModel):
         :type filter_role: int
         """
 
+        if (
+            rule_type is self._rule_type_filter
+            and filter_role == self._rule_type_filter_role
+        ):
+            # The filter has not changed, avoid re-filtering all the source model rows
+            return
+
         self._rule_type_filter = rule_type
         self._rule_type_filter_role = filter_role
         self._update()
@@ -105,6 +122,10 @@ class ValidationRuleProxyModel(FilterItemTreeProxyModel):
         checking acceptance of model data.
         """
 
+        if self._rule_type_filter is None:
+            # There is no filter to remove, avoid re-filtering all the source model rows
+            return
+
         self._rule_type_filter = None
         self._rule_type_filter_role = None
         self._update()
@@ -124,9 +145,65 @@ class ValidationRuleProxyModel(FilterItemTreeProxyModel):
         self._error_filter_active = on
         self._update()
 
+    #########################################################################################################
+    # Override Qt methods
+
+    def setSourceModel(self, source_model):
+        """
+        Override the base method.
+
+        Clear the cached text filter data when the source model data changes.
+
+        :param source_model: The source model to set.
+        :type source_model: :class:`sgtk.platform.qt.QtCore.QAbstractItemModel`
+        """
+
+        prev_source_model = self.sourceModel()
+        if prev_source_model:
+            disconnect_model_changed(
+                prev_source_model, self._clear_text_filter_data_cache
+            )
+
+        super().setSourceModel(source_model)
+        self._clear_text_filter_data_cache()
+
+        if source_model:
+            connect_model_changed(source_model, self._clear_text_filter_data_cache)
+
     #########################################################################################################
     # Protected methods
 
+    def _clear_text_filter_data_cache(self, *args, **kwargs):
+        """
+        Clear the cached text filter data.
+
+        This method accepts any arguments, see `connect_model_changed`.
+        """
+
+        self._text_filter_data_cache.clear()
+
+    def _get_text_filter_data(self, index):
+        """
+        Get the data for the source index to compare with the text filter value.
+
+        The data is retrieved by the text filter data function and cached until the source model changes.
+
+        :param index: The source model index to get the data for.
+        :type index: :class:`sgtk.platform.qt.QtCore.QModelIndex`
+
+        :return: The data to compare with the text filter value.
+        :rtype: str
+        """
+
+        # The internal id identifies the index parent, it is stable until the model layout changes
+        key = (index.row(), index.column(), index.internalId())
+        try:
+            return self._text_filter_data_cache[key]
+        except KeyError:
+            data = self._text_filter_data_func(index)
+            self._text_filter_data_cache[key] = data
+            return data
+
     def _update(self):
         """
         Invalidate the proxy model filter to re-evaluate the source model data. Each item in the source model
@@ -251,12 +251,21 @@ class ValidationRuleTypeModel(QtGui.QStandardItemModel, ViewItemRolesMixin):
             # No rules provided, this will refresh the model. Save the current rules before resetting them.
             rule_types = self._rules_types
 
-        self.clear()
-        self._rule_types = rule_types
-
-        for rule_type in self._rule_types:
-            rule_model_item = self.ValidationRuleTypeModelItem(rule_type)
-            self.invisibleRootItem().appendRow(rule_model_item)
+        # Block signals while clearing and adding the items, so that views only receive the single
+        # model reset signal emitted at the end, instead of one signal per item.
+        restore_state = self.blockSignals(True)
+        try:
+            self.clear()
+            self._rule_types = rule_types
+
+            self.invisibleRootItem().appendRows(
+                [
+                    self.ValidationRuleTypeModelItem(rule_type)
+                    for rule_type in self._rule_types
+                ]
+            )
+        finally:
+            self.blockSignals(restore_state)
 
         self.endResetModel()
 
@@ -0,0 +1,72 @@
+# Copyright (c) 2022 Autodesk, Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk, Inc.
+
+
+def get_model_changed_signals(model, data_changed=True):
+    """
+    Get the model signals that indicate the model data or structure has changed.
+
+    These are the signals that cached model data must be cleared on.
+
+    :param model: The model to get the signals for.
+    :type model: :class:`sgtk.platform.qt.QtCore.QAbstractItemModel`
+    :param data_changed: False to exclude the dataChanged signal, for caches that handle it
+        separately.
+    :type data_changed: bool
+
+    :return: The model signals.
+    :rtype: tuple
+    """
+
+    signals = (
+        model.modelReset,
+        model.layoutChanged,
+        model.rowsInserted,
+        model.rowsRemoved,
+        model.rowsMoved,
+    )
+
+    if data_changed:
+        return (model.dataChanged,) + signals
+    return signals
+
+
+def connect_model_changed(model, slot, data_changed=True):
+    """
+    Connect the slot to the model signals that indicate the model data or structure has changed.
+
+    The slot must accept any arguments, since the signals have different arguments.
+
+    :param model: The model to connect to.
+    :type model: :class:`sgtk.platform.qt.QtCore.QAbstractItemModel`
+    :param slot: The slot to connect.
+    :type slot: callable
+    :param data_changed: False to not connect the dataChanged signal.
+    :type data_changed: bool
+    """
+
+    for signal in get_model_changed_signals(model, data_changed=data_changed):
+        signal.connect(slot)
+
+
+def disconnect_model_changed(model, slot, data_changed=True):
+    """
+    Disconnect the slot from the model signals, connected by `connect_model_changed`.
+
+    :param model: The model to disconnect from.
+    :type model: :class:`sgtk.platform.qt.QtCore.QAbstractItemModel`
+    :param slot: The slot to disconnect.
+    :type slot: callable
+    :param data_changed: False if the dataChanged signal was not connected.
+    :type data_changed: bool
+    """
+
+    for signal in get_model_changed_signals(model, data_changed=data_changed):
+        signal.disconnect(slot)
@@ -40,17 +40,30 @@ class ShotGridOverlayWidget(SGQWidget):
         self._title_word_wrap = True
         self._title_max_width = None
 
+        # The layout and widgets are created the first time the overlay is shown, since many overlays
+        # are never shown.
+        self._ui_built = False
+
+        # Initialize the overlay to be hidden
+        self.hide()
+
+    def _ensure_ui(self):
+        """
+        Set up the overlay widgets, if not already done.
+        """
+
+        if self._ui_built:
+            return
+        self._ui_built = True
+
         # Set up the layout and widgets
         self._setup_ui()
 
         # Hook up a listener to the parent window so this widget follows along when the parent
         # window changes size
-        filter = ResizeEventFilter(parent)
+        filter = ResizeEventFilter(self.parentWidget())
         filter.resized.connect(self._on_parent_resized)
-        parent.installEventFilter(filter)
-
-        # Initialize the overlay to be hidden
-        self.hide()
+        self.parentWidget().installEventFilter(filter)
 
     def _setup_ui(self):
         """
@@ -62,6 +75,7 @@ class ShotGridOverlayWidget(SGQWidget):
         frame.setAutoFillBackground(False)
         frame.setFrameShape(QtGui.QFrame.StyledPanel)
         frame.setFrameShadow(QtGui.QFrame.Raised)
+        self._frame = frame
 
         # The spinner widget displayed in a QLabel
         self._spinner_label = SGQLabel(frame)
@@ -77,6 +91,8 @@ class ShotGridOverlayWidget(SGQWidget):
         # The title text
         self._title_label = SGQLabel(frame)
         self._title_label.setTextFormat(QtCore.Qt.RichText)
+        self._title_text_format = QtCore.Qt.RichText
+        self._title_style = ""
         self._title_label.setOpenExternalLinks(True)
         self._title_label.setSizePolicy(
             QtGui.QSizePolicy(QtGui.QSizePolicy.Expanding, QtGui.QSizePolicy.Preferred)
@@ -85,6 +101,8 @@ class ShotGridOverlayWidget(SGQWidget):
         # The details text
         self._details_label = SGQLabel(frame)
         self._details_label.setTextFormat(QtCore.Qt.RichText)
+        self._details_text_format = QtCore.Qt.RichText
+        self._details_style = ""
         self._details_label.setWordWrap(True)
         self._details_label.setOpenExternalLinks(True)
         self._details_label.setAlignment(
@@ -136,6 +154,7 @@ class ShotGridOverlayWidget(SGQWidget):
 
         This object can be modified to customize the title label appearance.
         """
+        self._ensure_ui()
         return self._title_label
 
     @property
@@ -145,6 +164,7 @@ class ShotGridOverlayWidget(SGQWidget):
 
         This object can be modified to customize the details label appearance.
         """
+        self._ensure_ui()
         return self._details_label
 
     @property
@@ -154,6 +174,7 @@ class ShotGridOverlayWidget(SGQWidget):
 
         This object can be modified to customize the image label appearance.
         """
+        self._ensure_ui()
         return self._image_label
 
     @property
@@ -200,6 +221,7 @@ class ShotGridOverlayWidget(SGQWidget):
         Subclass the base method to show the overlay widget.
         """
 
+        self._ensure_ui()
         super().show()
 
         # Ensure to resize the overlay according to its parent widget size.
@@ -208,7 +230,9 @@ class ShotGridOverlayWidget(SGQWidget):
     ##########################################################################################################
     # Public methods
 
-    def show_message(self, title=None, image=None, details=None):
+    def show_message(
+        self, title=None, image=None, details=None, title_color=None, details_color=None
+    ):
         """
         Show the overlay message with the given data.
 
@@ -216,29 +240,56 @@ class ShotGridOverlayWidget(SGQWidget):
 
         NOTE: the same method name is used from the ShotgunOverlay widget to ease switching to use this new
         more generic and customizable overlay.
-        """
-
-        # Ensure the spinner is hdiden
-        self.stop_spin()
 
-        self._set_data(title=title, image=image, details=details)
+        :param title: The title message text to display.
+        :type title: str
+        :param image: The image to display.
+        :type image: QIcon | QPixmap
+        :param details: The details info text to display.
+        :type details: str
+        :param title_color: The color to display the title with. The title is displayed as plain
+            text if it does not contain markup.
+        :type title_color: str
+        :param details_color: The color to display the details with. The details are displayed as
+            plain text if they do not contain markup.
+        :type details_color: str
+        """
 
-        if title is None:
-            self.title_label.hide()
-        else:
-            self.title_label.show()
+        self._ensure_ui()
+
+        # Suspend updates while the content changes so that the final state is laid out and
+        # painted in a single pass
+        self._frame.setUpdatesEnabled(False)
+        try:
+            # Ensure the spinner is hdiden
+            self.stop_spin()
+
+            self._set_data(
+                title=title,
+                image=image,
+                details=details,
+                title_color=title_color,
+                details_color=details_color,
+            )
+
+            if title is None:
+                self.title_label.hide()
+            else:
+                self.title_label.show()
 
-        if image is None:
-            self.image_label.hide()
-        else:
-            self.image_label.show()
+            if image is None:
+                self.image_label.hide()
+            else:
+                self.image_label.show()
 
-        if details is None:
-            self.details_label.hide()
-        else:
-            self.details_label.show()
+            if details is None:
+                self.details_label.hide()
+            else:
+                self.details_label.show()
 
-        self.show()
+            self.show()
+        finally:
+            self._frame.setUpdatesEnabled(True)
 
     def show_error_message(self, title=None, image=None, details=None):
         """
@@ -263,14 +314,20 @@ class ShotGridOverlayWidget(SGQWidget):
         Show the PTR spinner widget.
         """
 
-        # Hide the other widgets
-        self.image_label.hide()
-        self.title_label.hide()
-        self.details_label.hide()
+        self._ensure_ui()
+
+        self._frame.setUpdatesEnabled(False)
+        try:
+            # Hide the other widgets
+            self.image_label.hide()
+            self.title_label.hide()
+            self.details_label.hide()
 
-        # Start the spinner and show the overlay
-        self._spinner.start_spin()
-        self.show()
+            # Start the spinner and show the overlay
+            self._spinner.start_spin()
+            self.show()
+        finally:
+            self._frame.setUpdatesEnabled(True)
 
     def stop_spin(self):
         """
@@ -280,13 +337,19 @@ class ShotGridOverlayWidget(SGQWidget):
         called again with the data to show.
         """
 
+        if not self._ui_built:
+            # Nothing to stop, the spinner has not been created yet.
+            return
+
         self._spinner_label.hide()
         self._spinner.hide()
 
     ##########################################################################################################
     # Protected methods
 
-    def _set_data(self, image=None, title=None, details=None):
+    def _set_data(
+        self, image=None, title=None, details=None, title_color=None, details_color=None
+    ):
         """
         Set the overlay image, title and details data.
 
@@ -298,6 +361,10 @@ class ShotGridOverlayWidget(SGQWidget):
         :type title: str
         :param details: The details info text to dispaly. This can be rich text to format and style the text.
         :type details: str
+        :param title_color: The color to display the title with.
+        :type title_color: str
+        :param details_color: The color to display the details with.
+        :type details_color: str
         """
 
         if isinstance(image, QtGui.QIcon):
@@ -335,9 +402,32 @@ class ShotGridOverlayWidget(SGQWidget):
             self._title_label.setMaximumWidth(title_max_width)
             self._title_label.setWordWrap(self.title_word_wrap or False)
 
+        # Text without markup is displayed as plain text, to avoid building a rich text document. The
+        # text color is set by the label style sheet, which applies to both plain and rich text.
+        title_format = _get_text_format(title)
+        title_style = f"color: {title_color};" if title_color else ""
+        if title_format != self._title_text_format:
+            self._title_label.setTextFormat(title_format)
+            self._title_text_format = title_format
+        if title_style != self._title_style:
+            self._title_label.setStyleSheet(title_style)
+            self._title_style = title_style
+
+        details_format = _get_text_format(details)
+        details_style = f"color: {details_color};" if details_color else ""
+        if details_format != self._details_text_format:
+            self._details_label.setTextFormat(details_format)
+            self._details_text_format = details_format
+        if details_style != self._details_style:
+            self._details_label.setStyleSheet(details_style)
+            self._details_style = details_style
+
         self._image_label.setPixmap(pixmap)
-        self._title_label.setText(title)
-        self._details_label.setText(details)
+        # Only set the text when it changed, the same message is often shown repeatedly
+        if (title or "") != self._title_label.text():
+            self._title_label.setText(title)
+        if (details or "") != self._details_label.text():
+            self._details_label.setText(details)
 
     def _on_parent_resized(self):
         """
@@ -351,6 +441,22 @@ class ShotGridOverlayWidget(SGQWidget):
         self._spinner.resize(self.parentWidget().size())
 
 
+def _get_text_format(text):
+    """
+    Get the format to display the given text with.
+
+    :param text: The text to display.
+    :type text: str
+
+    :return: Rich text format if the text contains markup, else plain text format.
+    :rtype: QtCore.Qt.TextFormat
+    """
+
+    if text and "<" in text and ">" in text:
+        return QtCore.Qt.RichText
+    return QtCore.Qt.PlainText
+
+
 class ResizeEventFilter(QtCore.QObject):
     """
     Utility and helper.
@@ -0,0 +1,100 @@
+# Copyright (c) 2022 Autodesk, Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk, Inc.
+
+from collections import OrderedDict
+
+import sgtk
+from sgtk.platform.qt import QtCore, QtGui
+
+from ..utils.framework_qtwidgets import ViewItemDelegate
+
+
+class SizeHintCacheDelegate(ViewItemDelegate):
+    """
+    A ViewItemDelegate subclass that caches the size hint of items that share the same layout.
+
+    The cache key for an index is returned by the `size_hint_key` function. Indexes that do not have a key
+    are not cached. The cache must be cleared when the model data or the delegate display properties
+    change, by calling `clear_size_hint_cache`. The least recently used sizes are evicted once the cache
+    holds more than `MAX_CACHE_SIZE` entries.
+    """
+
+    MAX_CACHE_SIZE = 256
+
+    def __init__(self, view, size_hint_key=None):
+        """
+        Create the SizeHintCacheDelegate.
+
+        :param view: The view that this delegate is used for.
+        :type view: QtGui.QAbstractItemView
+        :param size_hint_key: A function that takes a model index and returns a hashable key identifying
+            the size of the index, or None to not cache the size of the index.
+        :type size_hint_key: function
+        """
+
+        super().__init__(view)
+
+        self._size_hint_key = size_hint_key
+        self._size_hint_cache = OrderedDict()
+
+    @property
+    def size_hint_key(self):
+        """Get or set the function returning the size hint cache key for an index."""
+        return self._size_hint_key
+
+    @size_hint_key.setter
+    def size_hint_key(self, key_func):
+        self._size_hint_key = key_func
+        self.clear_size_hint_cache()
+
+    def clear_size_hint_cache(self, *args, **kwargs):
+        """
+        Clear the cached size hints.
+
+        This method accepts any arguments, see `connect_model_changed`.
+        """
+
+        self._size_hint_cache.clear()
+
+    def sizeHint(self, option, index):
+        """
+        Override the base method.
+
+        Return the cached size hint for the index, if there is one.
+
+        :param option: The option used for rendering the item.
+        :type option: :class:`sgtk.platform.qt.QtGui.QStyleOptionViewItem`
+        :param index: The index of the item to get the size hint for.
+        :type index: :class:`sgtk.platform.qt.QtCore.QModelIndex`
+
+        :return: The size hint for the item.
+        :rtype: :class:`sgtk.platform.qt.QtCore.QSize`
+        """
+
+        if self._size_hint_key is None:
+            return super().sizeHint(option, index)
+
+        key = self._size_hint_key(index)
+        if key is None:
+            return super().sizeHint(option, index)
+
+        # The size depends on the width available to the item
+        key = (key, option.rect.width(), self.parent().viewport().width())
+        size = self._size_hint_cache.get(key)
+        if size is None:
+            size = QtCore.QSize(super().sizeHint(option, index))
+            self._size_hint_cache[key] = size
+            if len(self._size_hint_cache) > self.MAX_CACHE_SIZE:
+                self._size_hint_cache.popitem(last=False)
+        else:
+            self._size_hint_cache.move_to_end(key)
+
+        # Return a copy so that the cached size cannot be modified
+        return QtCore.QSize(size)
@@ -9,7 +9,8 @@
 # not expressly granted therein are reserved by Autodesk, Inc.
 
 from __future__ import annotations
-from typing import Union, List
+from functools import partial
+from typing import Union, List, Sequence
 
 from sgtk.platform.qt import QtCore, QtGui
 
@@ -25,8 +26,76 @@ from ..utils.framework_qtwidgets import (
     SGQPushButton,
     SGQMenu,
 )
-from .shotgrid_overlay_widget import ShotGridOverlayWidget
+from .shotgrid_overlay_widget import ShotGridOverlayWidget, _get_text_format
+from .size_hint_cache_delegate import SizeHintCacheDelegate
 from ..utils.decorators import wait_cursor
+from ..utils.model_signals import connect_model_changed
+
+
+# The text and colors used to display the rule details
+_DEPENDENCIES_TEXT = "Dependencies that will run with this fix:"
+_NO_DEPENDENCIES_TEXT = "No dependencies."
+_ERROR_COLOR = "#EB5555"
+_WARNING_COLOR = "#FBB549"
+
+# The actions returned for details items that have no actions, shared to avoid creating empty lists
+_NO_ACTIONS = ()
+
+# The static configuration for the details view delegate actions. The get_data and callback functions
+# are added when the delegate is created.
+_DETAILS_ITEM_ACTION = {
+    "type": ViewItemAction.TYPE_PUSH_BUTTON,
+    "padding": 2,
+}
+_DETAILS_SHOW_MORE_ACTION = {
+    "type": ViewItemAction.TYPE_PUSH_BUTTON,
+    "show_always": True,
+    "padding": 0,
+    "features": QtGui.QStyleOptionButton.Flat,
+}
+
+
+class _DetailsState:
+    """
+    The cached data of a ValidationDetailsWidget, used to avoid redoing work when the widget is refreshed.
+
+    The data is held in slots instead of the widget instance dict.
+    """
+
+    __slots__ = (
+        "last_desc_key",
+        "last_desc_html",
+        "rule_cache",
+        "context_menu_key",
+        "named_item_actions",
+        "named_item_actions_rule",
+        "toolbar_signature",
+        "item_actions_by_id",
+        "last_refresh_signature",
+        "overlay_message",
+    )
+
+    def __init__(self):
+        """Create the details state, with nothing cached."""
+
+        # The last description text, and the key it was built for
+        self.last_desc_key = None
+        self.last_desc_html = None
+        # The rule dependency names and messages, keyed by rule. Only the displayed rule is cached.
+        self.rule_cache = {}
+        # The (rule, item ids) that the context menu actions were last set up for
+        self.context_menu_key = None
+        # The rule item actions that have a name, and the rule they were collected for
+        self.named_item_actions = None
+        self.named_item_actions_rule = None
+        # The state of the rule that the toolbar buttons were last created for
+        self.toolbar_signature = None
+        # The actions for each details item, keyed by item id. Cleared on each refresh.
+        self.item_actions_by_id = {}
+        # The state of the rule that the widget was last refreshed for
+        self.last_refresh_signature = None
+        # The (title, details, title color) of the overlay message shown, or None if the overlay is hidden
+        self.overlay_message = None
 
 
 class ValidationDetailsWidget(SGQWidget):
@@ -45,6 +114,9 @@ class ValidationDetailsWidget(SGQWidget):
     about_to_execute_action = QtCore.Signal(dict)
     execute_action_finished = QtCore.Signal(dict)
 
+    # The size policy for the details group box, shared by all instances. See _details_size_policy
+    _DETAILS_SIZE_POLICY = None
+
     def __init__(self, parent, pre_validate_before_actions=True):
         """
         Create the validation details widget.
@@ -63,8 +135,30 @@ class ValidationDetailsWidget(SGQWidget):
         self._show_description = True
         self._pre_validate_before_actions = pre_validate_before_actions
 
-        self._setup_ui()
-        self._connect_signals()
+        # The cached data used to avoid redoing work when the widget is refreshed
+        self._state = _DetailsState()
+
+        # The context menu for the details items is created once per rule and reused
+        self._context_menu = None
+        self._context_menu_rule = None
+        self._context_menu_actions = {}
+        self._context_menu_slots = {}
+
+        # Coalesce deferred refresh requests made in quick succession (e.g. when moving through the rules
+        # list) into a single refresh, run once the event loop is idle.
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._run_refresh)
+
+        # The details item view and its overlay are created the first time a rule with details items
+        # is displayed, see _ensure_item_view.
+        self._details_item_view = None
+        self._details_view_item_delegate = None
+        self._details_item_view_overlay = None
+
+        # The widget UI is created the first time that it is needed, see _ensure_ui
+        self._ui_ready = False
 
     #########################################################################################################
     # Properties
@@ -100,161 +194,461 @@ class ValidationDetailsWidget(SGQWidget):
     ######################################################################################################
     # Public methods
 
-    def set_data(self, rule):
+    def set_data(self, rule, deferred=False):
         """
         Set up the details data for the given validation rule.
 
         :param rule: The validation rule that the details is showing information for.
         :type rule: ValidationRule
+        :param deferred: True to defer the refresh until control returns to the event loop, such that
+            multiple requests made in quick succession result in a single refresh. Default False.
+        :type deferred: bool
         """
 
+        self._ensure_ui()
+
+        # Setting the rule that is already displayed does not rebuild the widget, the refresh is skipped
+        # if the rule state has not changed, see _get_refresh_signature
         self._rule = rule
-        self.refresh()
 
-    def refresh(self):
+        # Evict cached data for rules that are no longer displayed
+        if rule is None:
+            self._state.rule_cache = {}
+        else:
+            self._state.rule_cache = {
+                k: v for k, v in self._state.rule_cache.items() if k is rule
+            }
+
+        self._request_refresh(deferred)
+
+    def refresh(self, deferred=False):
         """
         Refresh the current data in the widget.
+
+        :param deferred: True to defer the refresh until control returns to the event loop, such that
+            multiple requests made in quick succession result in a single refresh. Default False.
+        :type deferred: bool
         """
 
-        if not self.rule:
+        # The rule data may have changed, clear the cached messages and force the refresh
+        self._state.last_refresh_signature = None
+        self._state.context_menu_key = None
+        if self.rule:
+            rule_cache = self._state.rule_cache.get(self.rule)
+            if rule_cache:
+                rule_cache.pop("state", None)
+
+        self._request_refresh(deferred)
+
+    ######################################################################################################
+    # Override Qt methods
+
+    def showEvent(self, event):
+        """
+        Override the base method.
+
+        Create the widget UI before it is shown for the first time.
+
+        :param event: The show event.
+        :type event: QtGui.QShowEvent
+        """
+
+        self._ensure_ui()
+        super().showEvent(event)
+
+    ######################################################################################################
+    # Protected methods
+
+    def _ensure_ui(self):
+        """
+        Create the widget UI and connect its signals, if not already created.
+        """
+
+        if self._ui_ready:
+            return
+
+        self._ui_ready = True
+        self._setup_ui()
+        self._connect_signals()
+
+    def _request_refresh(self, deferred):
+        """
+        Refresh the widget now, or schedule a refresh if one is not already pending.
+
+        :param deferred: True to schedule the refresh, False to refresh now.
+        :type deferred: bool
+        """
+
+        if not deferred:
+            # Refreshing now also runs any pending refresh
+            self._run_refresh()
+        elif not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _get_rule_cache(self):
+        """
+        Get the cached data for the current rule.
+
+        The dependency names only depend on the rule definition and are cached for as long as the rule is
+        displayed. The error and warning messages are cleared when the rule state changes.
+
+        :return: The cached data for the current rule.
+        :rtype: dict
+        """
+
+        rule = self._rule
+        rule_cache = self._state.rule_cache.get(rule)
+        if rule_cache is None:
+            rule_cache = {"dependency_names": list(rule.get_dependency_names())}
+            self._state.rule_cache[rule] = rule_cache
+
+        state = (
+            rule.valid,
+            rule.error_count,
+            rule.errors,
+            rule.fix_executed,
+            rule.manual_checked,
+            rule.has_failed_dependency(),
+        )
+        if rule_cache.get("state") != state:
+            rule_cache["state"] = state
+            rule_cache.pop("error_messages", None)
+            rule_cache.pop("warning_messages", None)
+
+        return rule_cache
+
+    def _get_dependency_names(self):
+        """
+        Get the dependency names for the current rule.
+
+        :return: The dependency names.
+        :rtype: list<str>
+        """
+
+        return self._get_rule_cache()["dependency_names"]
+
+    def _get_error_messages(self):
+        """
+        Get the error messages for the current rule.
+
+        :return: The error messages.
+        :rtype: list<str>
+        """
+
+        rule_cache = self._get_rule_cache()
+        if "error_messages" not in rule_cache:
+            rule_cache["error_messages"] = self.rule.get_error_messages()
+        return rule_cache["error_messages"]
+
+    def _get_warning_messages(self):
+        """
+        Get the warning messages for the current rule.
+
+        :return: The warning messages.
+        :rtype: list<str>
+        """
+
+        rule_cache = self._get_rule_cache()
+        if "warning_messages" not in rule_cache:
+            rule_cache["warning_messages"] = self.rule.get_warning_messages()
+        return rule_cache["warning_messages"]
+
+    def _run_refresh(self):
+        """
+        Run the pending refresh.
+        """
+
+        self._refresh_timer.stop()
+        self._ensure_ui()
+
+        # Disable updates while the widget is refreshed, such that it is painted once at the end
+        restore_updates = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            self._do_refresh()
+        finally:
+            self.setUpdatesEnabled(restore_updates)
+
+    def _do_refresh(self):
+        """
+        Refresh the current data in the widget.
+        """
+
+        rule = self._rule
+        if not rule:
             # No data to refresh
+            self._state.item_actions_by_id = {}
+            self._state.last_refresh_signature = None
             return
 
+        refresh_signature = self._get_refresh_signature()
+        if refresh_signature == self._state.last_refresh_signature:
+            # The widget is already showing the current rule state
+            return
+
+        # Item actions are rebuilt on demand for the refreshed data
+        self._state.item_actions_by_id = {}
+        self._state.context_menu_key = None
+
         #
         # Set up details info
         #
-        self._details.setTitle(self.rule.name)
+        if self._details.title() != rule.name:
+            self._details.setTitle(rule.name)
+
+        dependencies_names = self._get_dependency_names()
+        desc_key = (rule, self.show_description, tuple(dependencies_names))
+        if desc_key != self._state.last_desc_key:
+            if dependencies_names:
+                deps = f"<li>{'</li><li>'.join(dependencies_names)}</li>"
+                dependencies_text = f"{_DEPENDENCIES_TEXT}<ul>{deps}</ul>"
+            else:
+                dependencies_text = _NO_DEPENDENCIES_TEXT
 
-        dependencies_names = self.rule.get_dependency_names()
-        if dependencies_names:
-            dependencies_text = (
-                "Dependencies that will run with this fix:<ul>{deps}</ul>".format(
-                    deps="".join(["<li>{}</li>".format(d) for d in dependencies_names])
-                )
-            )
-        else:
-            dependencies_text = "No dependencies."
+            if self.show_description:
+                desc = f"{rule.description}<br/><br/>"
+            else:
+                desc = ""
 
-        description = "<html>{desc}{space}{dependencies}</html>".format(
-            desc=self.rule.description if self.show_description else "",
-            space="<br/><br/>" if self.show_description and dependencies_text else "",
-            dependencies=dependencies_text,
-        )
-        self._details_description.setText(description)
+            if desc or dependencies_names:
+                text_format = QtCore.Qt.RichText
+                self._state.last_desc_html = f"<html>{desc}{dependencies_text}</html>"
+            else:
+                # Nothing to format, skip the rich text engine
+                text_format = QtCore.Qt.PlainText
+                self._state.last_desc_html = dependencies_text
+            self._state.last_desc_key = desc_key
+
+            if self._details_description.textFormat() != text_format:
+                self._details_description.setTextFormat(text_format)
+            if self._details_description.text() != self._state.last_desc_html:
+                self._details_description.setText(self._state.last_desc_html)
 
         #
         # Set up the details view
         #
-        if self.rule.manual:
+        if rule.manual:
             # No details list view for manual rules
-            self._details_item_view.hide()
+            if self._details_item_view is not None:
+                self._details_item_view.hide()
         else:
-            # Show the details list view and initialze the model data to display in the view
+            self._ensure_item_view()
+
+            # Initialze the model data to display in the view, and then show the view. Disable updates
+            # while the model is populated so that the view is not painted in a partial state, and block
+            # the selection signals emitted while the selection is cleared by the model reset.
+            self._details_item_view.setUpdatesEnabled(False)
+            selection_model = self._details_item_view.selectionModel()
+            restore_selection_signals = (
+                selection_model.blockSignals(True) if selection_model else None
+            )
+            named_actions = self._get_named_item_actions()
+            item_action_name = named_actions[0]["name"] if named_actions else None
+            try:
+                self._details_item_model.initialize_data(
+                    rule.errors, item_action_name=item_action_name
+                )
+            finally:
+                if selection_model:
+                    selection_model.blockSignals(restore_selection_signals)
+                self._details_item_view.setUpdatesEnabled(True)
             self._details_item_view.show()
-            self._details_item_model.initialize_data(self.rule.errors)
 
         #
         # Set up details action items
         #
-        self._details_toolbar.clear()
-        self._details_toolbar.add_stretch()
+        toolbar_signature = (
+            rule,
+            rule.valid,
+            tuple(id(a) for a in rule.actions),
+            rule.check_func is not None,
+            rule.fix_func is not None,
+        )
+        if toolbar_signature != self._state.toolbar_signature:
+            self._state.toolbar_signature = toolbar_signature
+            self._refresh_toolbar()
+
+        #
+        # Show/hide the overlay message
+        #
+        if rule.errors or rule.manual:
+            if self._state.overlay_message is not None:
+                self._details_item_view_overlay.hide()
+                self._state.overlay_message = None
+        else:
+            text = None
+            text_color = None
+            warnings = None
+
+            if rule.valid is None:
+                # Rule has not executed validate or fix yet
+                if rule.check_func is not None and rule.fix_func is not None:
+                    text = f"Click {rule.check_name} or {rule.fix_name} to see details."
+                elif rule.check_func is not None:
+                    text = f"Click {rule.check_name} to see details."
+                elif rule.fix_func is not None:
+                    text = f"Click {rule.fix_name} to see details."
+            elif rule.valid:
+                # Rule was validated and it succeedederrors
+                text = "Success! No errors found."
+            else:
+                # Rule was validated and it failed but did not report any error items.
+                # Show the rule's error message.
+                error_messages = self._get_error_messages()
+                if error_messages:
+                    text = _join_messages(error_messages)
+                    text_color = _ERROR_COLOR
+
+            warning_messages = self._get_warning_messages()
+            if warning_messages:
+                warnings = _join_messages(warning_messages)
+
+            overlay_message = (text, warnings, text_color)
+            if overlay_message != self._state.overlay_message:
+                self._details_item_view_overlay.show_message(
+                    title=text,
+                    details=warnings,
+                    title_color=text_color,
+                    details_color=_WARNING_COLOR if warnings else None,
+                )
+                self._state.overlay_message = overlay_message
+
+        self._state.last_refresh_signature = refresh_signature
+
+    def _get_refresh_signature(self):
+        """
+        Get the state of the current rule that the widget display depends on.
+
+        The widget does not need to be refreshed if the signature has not changed since the last
+        refresh. Calling `refresh` always refreshes the widget, for changes that the signature does
+        not capture.
+
+        :return: The refresh signature.
+        :rtype: tuple
+        """
+
+        rule = self._rule
+        return (
+            rule,
+            rule.valid,
+            rule.errors,
+            rule.error_count,
+            rule.actions,
+            rule.item_actions,
+            len(rule.dependencies),
+            rule.fix_executed,
+            rule.manual_checked,
+            rule.has_failed_dependency(),
+            self.show_description,
+        )
+
+    def _refresh_toolbar(self):
+        """
+        Update the details toolbar buttons for the current rule.
+
+        The toolbar buttons are kept in a pool and reused, only their text and callback are updated.
+        Buttons that are not needed are hidden.
+        """
+
+        rule = self._rule
+
+        # Get the (name, callback) for each button to show
+        buttons = []
 
         # Add check action
-        if self.rule.check_func is not None:
-            name = self.rule.check_name
+        if rule.check_func is not None:
+            name = rule.check_name
 
             # Check if the rule has already run its validation once, if so, modify the name to
             # prepend "Re", e.g. Validate -> Revalidate
-            if self.rule.valid is not None:
-                name = "Re{name}".format(name=name.lower())
-
-            check_button = SGQPushButton(name, self._details_toolbar)
+            if rule.valid is not None:
+                name = f"Re{name.lower()}"
 
-            check_button.clicked.connect(self._request_validate_rule)
-            self._details_toolbar.add_widget(check_button)
+            buttons.append((name, self._request_validate_rule))
 
         # Add fix action
-        if self.rule.fix_func is not None:
-            name = self.rule.fix_name
-            fix_button = SGQPushButton(name, self._details_toolbar)
-
-            fix_button.clicked.connect(self._request_fix_rule)
-            self._details_toolbar.add_widget(fix_button)
+        if rule.fix_func is not None:
+            buttons.append((rule.fix_name, self._request_fix_rule))
 
         # Add generic actions
-        for rule_action in self.rule.actions:
+        for rule_action in rule.actions:
             action_cb = rule_action.get("callback")
             if not action_cb:
                 continue
 
-            button = SGQPushButton(rule_action["name"], self._details_toolbar)
-            button.clicked.connect(
-                lambda checked=False, a=rule_action: self._execute_action(a)
+            buttons.append(
+                (rule_action["name"], partial(self._execute_action, rule_action))
             )
-            self._details_toolbar.add_widget(button)
 
-        #
-        # Show/hide the overlay message
-        #
-        if self.rule.errors or self.rule.manual:
-            self._details_item_view_overlay.hide()
-        else:
-            text = None
-            warnings = None
+        self._button_callbacks = [callback for _, callback in buttons]
 
-            if self.rule.valid is None:
-                # Rule has not executed validate or fix yet
-                if self.rule.check_func is not None and self.rule.fix_func is not None:
-                    text = "Click {} or {} to see details.".format(
-                        self.rule.check_name,
-                        self.rule.fix_name,
-                    )
-                elif self.rule.check_func is not None:
-                    text = "Click {} to see details.".format(self.rule.check_name)
-                elif self.rule.fix_func is not None:
-                    text = "Click {} to see details.".format(self.rule.fix_name)
-            elif self.rule.valid:
-                # Rule was validated and it succeedederrors
-                text = "Success! No errors found."
+        for i, (name, _) in enumerate(buttons):
+            if i < len(self._button_pool):
+                button = self._button_pool[i]
+                button.setText(name)
             else:
-                # Rule was validated and it failed but did not report any error items.
-                # Show the rule's error message.
-                error_messages = self.rule.get_error_messages()
-                if error_messages:
-                    text = "<span style='color:#EB5555;'>{}</span>".format(
-                        "<br/><br/>".join(error_messages)
-                    )
+                # Pool buttons are connected once, the clicked slot looks up the button callback
+                button = SGQPushButton(name, self._details_toolbar)
+                button.clicked.connect(self._on_toolbar_button_clicked)
+                self._details_toolbar.add_widget(button)
+                self._button_pool.append(button)
 
-            warning_messages = self.rule.get_warning_messages()
-            if warning_messages:
-                warnings = "<span style='color:#FBB549;'>{}</span>".format(
-                    "<br/><br/>".join(warning_messages)
-                )
+            button.setVisible(True)
 
-            self._details_item_view_overlay.show_message(title=text, details=warnings)
+        # Hide the buttons not used
+        for button in self._button_pool[len(buttons) :]:
+            button.setVisible(False)
 
-    ######################################################################################################
-    # Protected methods
+    @classmethod
+    def _details_size_policy(cls):
+        """
+        Get the size policy for the details group box.
+
+        The size policy is created once and shared by all instances.
+
+        :return: The size policy.
+        :rtype: QtGui.QSizePolicy
+        """
+
+        if cls._DETAILS_SIZE_POLICY is None:
+            cls._DETAILS_SIZE_POLICY = QtGui.QSizePolicy(
+                QtGui.QSizePolicy.Expanding, QtGui.QSizePolicy.Maximum
+            )
+        return cls._DETAILS_SIZE_POLICY
 
     def _setup_ui(self):
         """
         Set up the widget UI.
 
-        This should be called once when creating the widget.
+        This should be called once, see _ensure_ui.
         """
 
         self._details = SGQGroupBox(self)
         self._details.setMinimumWidth(200)
-        self._details.setSizePolicy(
-            QtGui.QSizePolicy(QtGui.QSizePolicy.Expanding, QtGui.QSizePolicy.Maximum)
-        )
+        self._details.setSizePolicy(self._details_size_policy())
         self._details_description = SGQLabel(self._details)
+        # The text format is set explicitly with the text, never auto-detected
+        self._details_description.setTextFormat(QtCore.Qt.PlainText)
         self._details_description.setWordWrap(True)
         details_vlayout = QtGui.QVBoxLayout()
         details_vlayout.addWidget(self._details_description)
         self._details.setLayout(details_vlayout)
 
         self._details_toolbar = SGQWidget(self)
+        self._details_toolbar.add_stretch()
+        self._button_pool = []
+        self._button_callbacks = []
+
+        self.layout().setContentsMargins(10, 0, 0, 0)
+        self.add_widgets([self._details, self._details_toolbar])
+
+    def _ensure_item_view(self):
+        """
+        Create the details item view and its overlay, if not already created.
+        """
+
+        if self._details_item_view is not None:
+            return
 
         self._details_item_view = GroupedItemView(self)
         self._details_item_view.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
@@ -267,18 +661,36 @@ class ValidationDetailsWidget(SGQWidget):
         self._details_item_view_overlay = ShotGridOverlayWidget(self._details_item_view)
         self._details_item_view_overlay.title_word_wrap = True
 
-        self.layout().setContentsMargins(10, 0, 0, 0)
-        self.add_widgets(
-            [self._details, self._details_toolbar, self._details_item_view]
-        )
+        self.add_widget(self._details_item_view)
+        self._connect_item_view_signals()
 
     def _connect_signals(self):
         """
         Set up and connect signal slots between widgets.
 
-        This should be called once when creating the widget.
+        This should be called once, see _ensure_ui.
         """
 
+        if self._details_item_view is not None:
+            self._connect_item_view_signals()
+
+    def _connect_item_view_signals(self):
+        """
+        Connect the details item view signals.
+
+        This should be called once when creating the details item view.
+        """
+
+        # Ensure the slots are never connected more than once
+        _disconnect_signal(
+            self._details_item_view.customContextMenuRequested,
+            self._on_details_item_context_menu_requested,
+        )
+        _disconnect_signal(
+            self._details_item_view.doubleClicked,
+            self._on_details_item_double_clicked,
+        )
+
         self._details_item_view.customContextMenuRequested.connect(
             self._on_details_item_context_menu_requested
         )
@@ -291,7 +703,13 @@ class ValidationDetailsWidget(SGQWidget):
         Create the delegate for the details item view and set it.
         """
 
-        delegate = ViewItemDelegate(self._details_item_view)
+        # Most rows in the details view have the same layout, cache their size hints
+        delegate = SizeHintCacheDelegate(
+            self._details_item_view, size_hint_key=get_details_item_size_hint_key
+        )
+        connect_model_changed(
+            self._details_item_model, delegate.clear_size_hint_cache, data_changed=False
+        )
         delegate.item_padding = ViewItemDelegate.Padding(0, 0, 0, 0)
         delegate.text_padding = ViewItemDelegate.Padding(10, 10, 10, 10)
         delegate.text_rect_valign = ViewItemDelegate.CENTER
@@ -303,24 +721,20 @@ class ValidationDetailsWidget(SGQWidget):
 
         # Action button - convenience button for the first button that appears in the item's actions list
         delegate.add_action(
-            {
-                "type": ViewItemAction.TYPE_PUSH_BUTTON,
-                "padding": 2,
-                "get_data": self._get_details_item_data,
-                "callback": self._details_item_action_callback,
-            },
+            dict(
+                _DETAILS_ITEM_ACTION,
+                get_data=get_details_item_action_data,
+                callback=self._details_item_action_callback,
+            ),
             ViewItemDelegate.RIGHT,
         )
         # Action button for footer item to show more/less items. Button is centered and spans width of row.
         delegate.add_action(
-            {
-                "type": ViewItemAction.TYPE_PUSH_BUTTON,
-                "show_always": True,
-                "padding": 0,
-                "features": QtGui.QStyleOptionButton.Flat,
-                "get_data": get_details_item_show_more_data,
-                "callback": details_item_show_more_callback,
-            },
+            dict(
+                _DETAILS_SHOW_MORE_ACTION,
+                get_data=get_details_item_show_more_data,
+                callback=details_item_show_more_callback,
+            ),
             ViewItemDelegate.CENTER,
         )
 
@@ -345,19 +759,53 @@ class ValidationDetailsWidget(SGQWidget):
         if not indexes:
             return
 
+        context_menu_key = (
+            self._rule,
+            tuple(
+                i.data(ValidationRuleDetailsModel.DETAILS_ITEM_ID_ROLE) for i in indexes
+            ),
+        )
+        if context_menu_key == self._state.context_menu_key:
+            # The menu is already set up for the selected items
+            self._context_menu.exec_(widget.mapToGlobal(pos))
+            return
+
         rule_actions = self._get_details_item_actions(indexes)
-        menu_actions = []
-        for item_action in rule_actions:
-            action = QtGui.QAction(item_action["name"])
-            action.triggered.connect(
-                lambda checked=False, a=item_action: self._execute_item_action(a)
-            )
-            menu_actions.append(action)
+        if not rule_actions:
+            return
+
+        if self._context_menu is None:
+            self._context_menu = SGQMenu(self)
+
+        if self._context_menu_rule is not self._rule:
+            # Create the menu actions for the current rule
+            self._context_menu.clear()
+            self._context_menu_actions = {}
+            self._context_menu_slots = {}
+            for item_action in self._rule.item_actions:
+                name = item_action.get("name")
+                if not name or name in self._context_menu_actions:
+                    continue
+                self._context_menu_actions[name] = self._context_menu.addAction(name)
+            self._context_menu_rule = self._rule
+
+        # Update the menu actions to execute on the selected items
+        actions_by_name = {a["name"]: a for a in rule_actions}
+        for name, menu_action in self._context_menu_actions.items():
+            prev_slot = self._context_menu_slots.pop(name, None)
+            if prev_slot is not None:
+                _disconnect_signal(menu_action.triggered, prev_slot)
+
+            item_action = actions_by_name.get(name)
+            menu_action.setVisible(item_action is not None)
+            if item_action is not None:
+                slot = partial(self._execute_item_action, item_action)
+                menu_action.triggered.connect(slot)
+                self._context_menu_slots[name] = slot
+        self._state.context_menu_key = context_menu_key
 
-        menu = SGQMenu(self)
-        menu.addActions(menu_actions)
         pos = widget.mapToGlobal(pos)
-        menu.exec_(pos)
+        self._context_menu.exec_(pos)
 
     def _get_details_item_actions(
         self,
@@ -367,39 +815,90 @@ class ValidationDetailsWidget(SGQWidget):
             List[QtCore.QModelIndex],
             List[QtCore.QStandardItem],
         ],
-    ) -> List[dict]:
+    ) -> Sequence[dict]:
         """
-        Get the list of actions for the details item.
+        Get the actions for the details item.
 
         :param index_or_item: The model index or item of the details item.
         :type index_or_item: QModelIndex | QStandardItem
 
-        :return: The list of actions for the details item.
-        :rtype: list<dict>
+        :return: The actions for the details item, an empty tuple if the item has no actions. The
+            returned actions must not be modified.
+        :rtype: Sequence<dict>
         """
 
-        if not self._rule or not index_or_item:
-            return []
+        # Check the rule actions first, to avoid reading the item data when there are no actions
+        if not self._rule or not self._rule.item_actions or not index_or_item:
+            return _NO_ACTIONS
+
+        named_actions = self._get_named_item_actions()
+        if not named_actions:
+            return _NO_ACTIONS
 
         if not isinstance(index_or_item, list):
-            index_or_item = [index_or_item]
+            item_id = index_or_item.data(
+                ValidationRuleDetailsModel.DETAILS_ITEM_ID_ROLE
+            )
+            if not item_id:
+                return _NO_ACTIONS
+            return self._get_item_actions(item_id)
 
-        actions_by_name = {}
+        item_ids = []
         for i in index_or_item:
             item_id = i.data(ValidationRuleDetailsModel.DETAILS_ITEM_ID_ROLE)
-            if not item_id:
-                continue
+            if item_id:
+                item_ids.append(item_id)
+        if not item_ids:
+            return _NO_ACTIONS
+
+        # Return copies of the rule actions, the rule action data is never modified
+        return [
+            dict(action, kwargs={"errors": list(item_ids)}) for action in named_actions
+        ]
+
+    def _get_item_actions(self, item_id):
+        """
+        Get the list of actions for a single details item.
+
+        The actions are cached by item id until the next refresh. The returned action data must
+        not be modified.
+
+        :param item_id: The details item id.
+        :type item_id: str
+
+        :return: The list of actions for the details item.
+        :rtype: list<dict>
+        """
+
+        actions = self._state.item_actions_by_id.get(item_id)
+        if actions is None:
+            actions = [
+                dict(action, kwargs={"errors": [item_id]})
+                for action in self._get_named_item_actions()
+            ]
+            self._state.item_actions_by_id[item_id] = actions
+        return actions
+
+    def _get_named_item_actions(self):
+        """
+        Get the current rule item actions that have a name.
+
+        Actions with the same name are only included once. The result is cached for the current rule.
+
+        :return: The named item actions.
+        :rtype: tuple<dict>
+        """
+
+        if self._state.named_item_actions_rule is not self._rule:
+            actions_by_name = {}
             for action in self._rule.item_actions:
                 action_name = action.get("name")
-                if not action_name:
-                    continue
-                if action_name in actions_by_name:
-                    actions_by_name[action_name]["kwargs"]["errors"].append(item_id)
-                else:
-                    actions_by_name[action_name] = dict(action)
-                    actions_by_name[action_name]["kwargs"] = {"errors": [item_id]}
+                if action_name and action_name not in actions_by_name:
+                    actions_by_name[action_name] = action
+            self._state.named_item_actions = tuple(actions_by_name.values())
+            self._state.named_item_actions_rule = self._rule
 
-        return list(actions_by_name.values())
+        return self._state.named_item_actions
 
     def _get_details_item_first_action(self, index):
         """
@@ -431,7 +930,7 @@ class ValidationDetailsWidget(SGQWidget):
         return self._execute_item_action(action)
 
     @wait_cursor
-    def _execute_action(self, action):
+    def _execute_action(self, action, checked=False):
         """
         Execute the action.
 
@@ -442,6 +941,8 @@ class ValidationDetailsWidget(SGQWidget):
 
         :parm action: The action to execute.
         :type action: dict
+        :param checked: Unused, passed by the button clicked signal.
+        :type checked: bool
 
         :return: The value returned by the action.
         :rtype: any
@@ -470,7 +971,7 @@ class ValidationDetailsWidget(SGQWidget):
         return result
 
     @wait_cursor
-    def _execute_item_action(self, action):
+    def _execute_item_action(self, action, checked=False):
         """
         Execute the item action.
 
@@ -481,6 +982,8 @@ class ValidationDetailsWidget(SGQWidget):
 
         :parm action: The item action to execute.
         :type action: dict
+        :param checked: Unused, passed by the menu action triggered signal.
+        :type checked: bool
 
         :return: The value returned by the item action.
         :rtype: any
@@ -527,6 +1030,24 @@ class ValidationDetailsWidget(SGQWidget):
 
         self._execute_details_item_first_action(index)
 
+    def _on_toolbar_button_clicked(self, checked=False):
+        """
+        Callback triggered when a toolbar button is clicked.
+
+        Execute the callback currently assigned to the button.
+
+        :param checked: Unused, passed by the button clicked signal.
+        :type checked: bool
+        """
+
+        try:
+            index = self._button_pool.index(self.sender())
+        except ValueError:
+            return
+
+        if index < len(self._button_callbacks):
+            self._button_callbacks[index]()
+
     def _request_validate_rule(self):
         """
         Request to execute the rule check function.
@@ -550,32 +1071,6 @@ class ValidationDetailsWidget(SGQWidget):
     ######################################################################################################
     # ViewItemDelegate callback functions
 
-    def _get_details_item_data(self, parent, index):
-        """
-        Callback function triggered by the ViewItemDelegate.
-
-        Get the data for displaying the details item action.
-
-        :param parent: The parent of the ViewItemDelegate which triggered this callback
-        :type parent: QAbstractItemView
-        :param index: The index the action is for.
-        :type index: :class:`sgtk.platform.qt.QtCore.QModelIndex`
-
-        :return: The data for the action and index.
-        :rtype: dict (see the ViewItemAction class attribute `get_data` for more details)
-        """
-
-        action = self._get_details_item_first_action(index)
-
-        if action:
-            visible = True
-            name = action["name"]
-        else:
-            visible = False
-            name = ""
-
-        return {"visible": visible, "name": name}
-
     def _details_item_action_callback(self, view, index, pos):
         """
         The details item action was triggered.
@@ -593,16 +1088,55 @@ class ValidationDetailsWidget(SGQWidget):
         self._execute_details_item_first_action(index)
 
 
+def _join_messages(messages):
+    """
+    Join the messages into a paragraph per message.
+
+    Messages that contain markup are joined as rich text. Otherwise, the messages are joined as
+    plain text, and the whitespace within each message is collapsed, the same as it would be when
+    displayed as rich text.
+
+    :param messages: The messages to join.
+    :type messages: list<str>
+
+    :return: The joined messages.
+    :rtype: str
+    """
+
+    if any(_get_text_format(message) == QtCore.Qt.RichText for message in messages):
+        return "<br/><br/>".join(messages)
+
+    return "\n\n".join(" ".join(message.split()) for message in messages)
+
+
+def _disconnect_signal(signal, slot):
+    """
+    Disconnect the slot from the signal, if it is connected.
+
+    :param signal: The signal to disconnect from.
+    :type signal: QtCore.Signal
+    :param slot: The slot to disconnect.
+    :type slot: callable
+    """
+
+    try:
+        signal.disconnect(slot)
+    except (TypeError, RuntimeError):
+        # The slot was not connected
+        pass
+
+
 ######################################################################################################
 # ViewItemDelegate callback functions (independent of the ValidationDetailsWidget)
 #
 
 
-def get_details_item_show_more_data(parent, index):
+def get_details_item_action_data(parent, index):
     """
     Callback function triggered by the ViewItemDelegate.
 
-    Get the data for displaying the footer action to show more items.
+    Get the data for displaying the details item action. The data is computed once per model item,
+    and read directly from the item to avoid converting it to and from a QVariant on each paint.
 
     :param parent: The parent of the ViewItemDelegate which triggered this callback
     :type parent: QAbstractItemView
@@ -613,16 +1147,59 @@ def get_details_item_show_more_data(parent, index):
     :rtype: dict (see the ViewItemAction class attribute `get_data` for more details)
     """
 
-    is_footer = index.data(ValidationRuleDetailsModel.IS_FOOTER_ROLE)
+    item = index.model().itemFromIndex(index)
+    if item is None:
+        return ValidationRuleDetailsModel.HIDDEN_ACTION_BUTTON_DATA
+    return item.action_button_data
+
+
+def get_details_item_show_more_data(
+    parent, index, _data_role=ValidationRuleDetailsModel.SHOW_MORE_DATA_ROLE
+):
+    """
+    Callback function triggered by the ViewItemDelegate.
+
+    Get the data for displaying the footer action to show more items. The data is computed by the
+    model when its items change.
+
+    The model role is bound as a default argument to avoid looking it up on each paint.
+
+    :param parent: The parent of the ViewItemDelegate which triggered this callback
+    :type parent: QAbstractItemView
+    :param index: The index the action is for.
+    :type index: :class:`sgtk.platform.qt.QtCore.QModelIndex`
+
+    :return: The data for the action and index.
+    :rtype: dict (see the ViewItemAction class attribute `get_data` for more details)
+    """
+
+    return index.data(_data_role) or ValidationRuleDetailsModel.HIDDEN_SHOW_MORE_DATA
+
+
+def get_details_item_size_hint_key(
+    index,
+    _layout_role=ValidationRuleDetailsModel.ITEM_LAYOUT_ROLE,
+    _layout_group=ValidationRuleDetailsModel.LAYOUT_GROUP,
+    _header_role=ValidationRuleDetailsModel.VIEW_ITEM_HEADER_ROLE,
+):
+    """
+    Get the key to cache the size hint of the details item with.
+
+    Items with the same layout displaying the same text have the same size. Group items are not
+    cached since their subtitle changes with the number of items displayed.
+
+    :param index: The index of the details item.
+    :type index: :class:`sgtk.platform.qt.QtCore.QModelIndex`
+
+    :return: The size hint cache key, or None if the size should not be cached.
+    :rtype: tuple | None
+    """
 
-    if is_footer:
-        visible = True
-        name = index.data(ValidationRuleDetailsModel.FOOTER_TEXT_ROLE)
-    else:
-        visible = False
-        name = ""
+    layout = index.data(_layout_role)
+    if layout is None or layout == _layout_group:
+        return None
 
-    return {"visible": visible, "name": name, "width": "100%"}
+    return (index.column(), layout, index.data(_header_role))
 
 
 def details_item_show_more_callback(view, index, pos):
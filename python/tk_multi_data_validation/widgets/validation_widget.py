@@ -8,10 +8,14 @@
 # agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Autodesk, Inc.
 
+from functools import partial
+from weakref import WeakKeyDictionary
+
 import sgtk
 from sgtk.platform.qt import QtCore, QtGui
 
 from .list_view_auto_height import ListViewAutoHeight
+from .size_hint_cache_delegate import SizeHintCacheDelegate
 from .validation_details_widget import ValidationDetailsWidget
 from ..api.data.validation_rule_type import ValidationRuleType
 from ..api.data.validation_rule import ValidationRule
@@ -37,6 +41,58 @@ from ..utils.framework_qtwidgets import (
     SGQIcon,
 )
 from ..utils.decorators import wait_cursor
+from ..utils.model_signals import connect_model_changed
+
+
+# The static configuration shared by the rule types and rules view delegate actions. The delegates add the
+# per action options, e.g. the get_data and callback functions, to a copy of these.
+_ICON_ACTION = {
+    "type": ViewItemAction.TYPE_ICON,
+    "show_always": True,
+}
+_CHECK_BOX_ACTION = {
+    "type": ViewItemAction.TYPE_CHECK_BOX,
+    "show_always": True,
+    "padding_top": 0,
+    "padding_bottom": 0,
+}
+_PUSH_BUTTON_ACTION = {
+    "type": ViewItemAction.TYPE_PUSH_BUTTON,
+    "padding": 2,
+}
+# The rules view overlay details text displayed when validation found no errors
+_NO_ERRORS_DETAILS_TEXT = "<br/>".join(
+    [
+        "<span style='font-size:24px; color:#309AFF;'>Awesome work!</span>",
+        "",
+        "<span style='font-size:14px;'>Success! No errors found. You're ready to publish.</span>",
+    ]
+)
+# The base style state for the delegate actions
+_BASE_ACTION_STATE = QtGui.QStyle.State_Active | QtGui.QStyle.State_Enabled
+# The style states for the checked and unchecked rule check box actions
+_CHECKED_ACTION_STATE = _BASE_ACTION_STATE | QtGui.QStyle.State_On
+_UNCHECKED_ACTION_STATE = _BASE_ACTION_STATE | QtGui.QStyle.State_Off
+# The style state flag for each item check state
+_CHECK_STATE_FLAG = {
+    QtCore.Qt.Checked: QtGui.QStyle.State_On,
+    QtCore.Qt.PartiallyChecked: QtGui.QStyle.State_NoChange,
+    QtCore.Qt.Unchecked: QtGui.QStyle.State_Off,
+}
+# Shared action data for the hidden actions, and the optional rule placeholder. The action data
+# is not modified, the cached get_data callbacks return a copy of the data.
+_INVISIBLE_ACTION_DATA = {"visible": False}
+_OPTIONAL_PLACEHOLDER_ACTION_DATA = {
+    "visible": True,
+    "placeholder": True,
+    "padding_left": 22,
+}
+# Whether or not a model is a proxy model, cached per model for mapping view indexes to source indexes
+_IS_PROXY_MODEL_CACHE = WeakKeyDictionary()
+# The rule types that the rule types view check box action applies to
+_CHECK_BOX_RULE_TYPE_IDS = frozenset(
+    (ValidationRuleType.RULE_TYPE_MANUAL, ValidationRuleType.RULE_TYPE_OPTIONAL)
+)
 
 
 class ValidationWidget(SGQWidget):
@@ -76,6 +132,14 @@ class ValidationWidget(SGQWidget):
         VIEW_MODE_GROUPED,
     ) = range(2)
 
+    # The time (ms) to wait after the search text is edited before filtering the rules
+    SEARCH_FILTER_DELAY = 50
+    # The time (ms) to wait after the rules models change before updating the rules view overlay
+    VIEW_OVERLAY_UPDATE_DELAY = 16
+
+    # The icons used by the widget, shared by all instances. See _get_icon
+    _ICON_CACHE = {}
+
     # Emit signals to indicate that the details widget is about to run an action, and when it has finished
     # (this is useful to # show a busy indicator, if the operation takes some time)
     details_about_to_execute_action = QtCore.Signal(dict)
@@ -105,7 +169,11 @@ class ValidationWidget(SGQWidget):
 
         self._view_mode = self.VIEW_MODE_GROUPED
         self._details_on = True
+        # Flag indicating if the details widget is shown, see _show_details
+        self._details_shown = False
         self._rule_type_filter_on = False
+        # Flag indicating if the rule types view geometry is updated on rule types model reset
+        self._rule_types_geometry_connected = False
         self._group_rules_by = group_rules_by
 
         # Flag indicating if validate is run before actions to ensure actions are applied to
@@ -118,6 +186,11 @@ class ValidationWidget(SGQWidget):
         self._is_validating_all = False
         # Flag indicating that we're in the middle of fixing all rules
         self._is_fixing_all = False
+        # Flag indicating that we're in the middle of validating or fixing a batch of rules, the view
+        # is updated once at the end of the batch
+        self._is_processing_batch = False
+        # The ids of the rules that currently have errors (to update the errors label)
+        self._error_rule_ids = set()
         # The current list of rules in progress (to update the progress bar)
         self.__progress_rules = []
         # The default warning status text
@@ -150,6 +223,7 @@ class ValidationWidget(SGQWidget):
 
         self.turn_on_rule_type_filter(self._rule_type_filter_on)
         self._show_details()
+        self._set_view_mode(self._view_mode, force=True)
 
         # -----------------------------------------------------
         # Initialize the widget data
@@ -160,9 +234,50 @@ class ValidationWidget(SGQWidget):
     #########################################################################################################
     # Static methods
 
+    @classmethod
+    def _get_icon(cls, name, **kwargs):
+        """
+        Get the SGQIcon for the given name.
+
+        The icon is created once and shared by all instances.
+
+        :param name: The name of the SGQIcon class method that creates the icon.
+        :type name: str
+        :param kwargs: The keyword arguments to create the icon with.
+        :type kwargs: dict
+
+        :return: The icon.
+        :rtype: QtGui.QIcon
+        """
+
+        key = (name, tuple(sorted(kwargs.items())))
+        icon = cls._ICON_CACHE.get(key)
+        if icon is None:
+            icon = getattr(SGQIcon, name)(**kwargs)
+            cls._ICON_CACHE[key] = icon
+        return icon
+
     @wait_cursor
-    def __execute_menu_action(self, action, callback, kwargs):
-        """Execute the menu action and show the busy cursor."""
+    def __execute_menu_action(self, action, callback, kwargs, rule=None):
+        """
+        Execute the menu action and show the busy cursor.
+
+        :param action: The action to execute.
+        :type action: dict
+        :param callback: The action callback function.
+        :type callback: function
+        :param kwargs: The keyword arguments to pass to the callback.
+        :type kwargs: dict
+        :param rule: (optional) The rule to pass the current errors of to the callback. The rule
+            is validated first, if the pre-validate before actions option is on.
+        :type rule: ValidationRule
+        """
+
+        if rule is not None:
+            errors = (
+                rule.get_errors() if self.pre_validate_before_actions else rule.errors
+            )
+            kwargs = dict(kwargs, errors=errors)
 
         self.details_about_to_execute_action.emit(action)
         try:
@@ -299,23 +414,29 @@ class ValidationWidget(SGQWidget):
             self.SETTINGS_SHOW_ONLY_ERRORS, self._errors_toggle.isChecked()
         )
         settings_manager.store(
-            self.SETTINGS_DETAILS_VISIBILITY, self._details_widget.isVisible()
+            self.SETTINGS_DETAILS_VISIBILITY,
+            self._details_widget is not None and self._details_widget.isVisible(),
         )
 
-        rule_type_selected = self._rule_types_view.selectedIndexes()
-        if rule_type_selected:
-            rule_type_selected = rule_type_selected[0]
+        # Check the selection model first to avoid building the selected indexes list when empty
+        rule_types_selection_model = self._rule_types_view.selectionModel()
+        if rule_types_selection_model and rule_types_selection_model.hasSelection():
+            rule_type_selected = rule_types_selection_model.selectedIndexes()[0]
             rule_type_id = rule_type_selected.data(
                 ValidationRuleTypeModel.RULE_TYPE_ID_ROLE
             )
             settings_manager.store(self.SETTINGS_SELECTED_RULE_TYPE_ID, rule_type_id)
 
-        # Flow Production Tracking settings cannot handle byte arrays, so just save it in the QSettings objects
-        settings_manager.store(
-            self.SETTINGS_VIEW_DETAILS_SPLITTER_STATE,
-            self._view_details_splitter.saveState(),
-            pickle_setting=False,
-        )
+        # Flow Production Tracking settings cannot handle byte arrays, so just save it in the QSettings objects.
+        # Only store the splitter state if it has changed since it was last restored or stored.
+        splitter_state = self._view_details_splitter.saveState()
+        if splitter_state != self._stored_splitter_state:
+            settings_manager.store(
+                self.SETTINGS_VIEW_DETAILS_SPLITTER_STATE,
+                splitter_state,
+                pickle_setting=False,
+            )
+            self._stored_splitter_state = splitter_state
 
         settings_manager.store(
             self.SETTINGS_FILTER_MENU_STATE, self._filter_menu.save_state()
@@ -329,58 +450,13 @@ class ValidationWidget(SGQWidget):
         :type settings_manager: UserSettings
         """
 
-        # Restore the filter menu state
-        menu_state = settings_manager.retrieve(self.SETTINGS_FILTER_MENU_STATE, None)
-        if not menu_state:
-            menu_state = {
-                "{role}.data_type".format(role=ValidationRuleModel.RULE_ITEM_ROLE): {},
-                "{role}.required".format(role=ValidationRuleModel.RULE_ITEM_ROLE): {},
-            }
-        self._filter_menu.restore_state(menu_state)
-
-        self.view_mode = settings_manager.retrieve(
-            self.SETTINGS_VIEW_MODE, self.VIEW_MODE_GROUPED
-        )
-
-        show_only_errors = settings_manager.retrieve(
-            self.SETTINGS_SHOW_ONLY_ERRORS, False
-        )
-        self._toggle_errors(show_only_errors)
-
-        show_details = settings_manager.retrieve(
-            self.SETTINGS_DETAILS_VISIBILITY, False
-        )
-        self._show_details(show_details)
-
-        if self._rule_type_filter_on:
-            rule_type_id = settings_manager.retrieve(
-                self.SETTINGS_SELECTED_RULE_TYPE_ID,
-                ValidationRuleType.RULE_TYPE_NONE,
-            )
-            rule_type_item = self._rule_types_model.get_item_for_rule_type(rule_type_id)
-            if rule_type_item:
-                rule_type_index = rule_type_item.index()
-            else:
-                rule_type_index = self._rule_types_model.index(0, 0)
-            self._rule_types_view.selectionModel().select(
-                rule_type_index,
-                QtGui.QItemSelectionModel.ClearAndSelect
-                | QtGui.QItemSelectionModel.Current,
-            )
-
-        auto_refresh = settings_manager.retrieve(
-            self.SETTINGS_AUTO_REFRESH, self.__auto_refresh
-        )
-        self._auto_refresh_option_action.setChecked(auto_refresh)
-        self._on_toggle_auto_refresh(auto_refresh)
-
-        splitter_state = settings_manager.retrieve(
-            self.SETTINGS_VIEW_DETAILS_SPLITTER_STATE, None
-        )
-        self._view_details_splitter.restoreState(splitter_state)
-
-        # Must set the splitter collapsible property after the state is restored, or else this property is overwritten
-        self._view_details_splitter.setChildrenCollapsible(False)
+        # Disable updates while the state is restored, such that the widget is painted once at the end
+        restore_updates = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            self._restore_state(settings_manager)
+        finally:
+            self.setUpdatesEnabled(restore_updates)
 
     def turn_on_details(self, on):
         """
@@ -396,8 +472,11 @@ class ValidationWidget(SGQWidget):
             self._details_button.show()
         else:
             self._details_button.hide()
-            self._details_widget.hide()
-            self._details_overlay_widget.hide()
+            if self._details_widget is not None:
+                self._details_widget.hide()
+                self._details_overlay_widget.hide()
+                self._details_overlay_message = None
+                self._details_shown = False
 
     def turn_on_rule_type_filter(self, on):
         """
@@ -414,6 +493,23 @@ class ValidationWidget(SGQWidget):
         else:
             self._rule_types_widget.hide()
 
+        # Mouse tracking is only needed to show the hover state of the rule types while they are shown
+        self._rule_types_view.setMouseTracking(on)
+
+        # Only update the rule types view geometry on model reset while the view is shown
+        if on and not self._rule_types_geometry_connected:
+            self._rule_types_model.modelReset.connect(
+                self._rule_types_view.updateGeometry
+            )
+            self._rule_types_geometry_connected = True
+            # Catch up on any model reset that happened while the view was hidden
+            self._rule_types_view.updateGeometry()
+        elif not on and self._rule_types_geometry_connected:
+            self._rule_types_model.modelReset.disconnect(
+                self._rule_types_view.updateGeometry
+            )
+            self._rule_types_geometry_connected = False
+
     def set_validation_rules(self, validation_rules, validation_rule_types=None):
         """
         Set the validation rule types and data for the widget.
@@ -429,17 +525,26 @@ class ValidationWidget(SGQWidget):
         # Reset the widget UI before setting the new data
         self.reset()
 
-        if self._rule_type_filter_on:
-            rule_types = validation_rule_types or []
-            if not rule_types:
-                # Not rule types provied, extract the rule types from the data
-                for rule in validation_rules:
-                    rule_types.append(rule.type)
-
-            if rule_types:
-                self._rule_types_model.initialize_data(rule_types)
-
-        self._rules_model.initialize_data(validation_rules)
+        # Disable updates while both models are reset, such that the widget is painted once at the end
+        restore_updates = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            if self._rule_type_filter_on:
+                rule_types = validation_rule_types
+                if not rule_types:
+                    # Not rule types provied, extract the unique rule types from the data, in order. Rule
+                    # types are not hashable, they are compared by id.
+                    rule_types_by_id = {}
+                    for rule in validation_rules:
+                        rule_types_by_id.setdefault(rule.type.id, rule.type)
+                    rule_types = list(rule_types_by_id.values())
+
+                if rule_types:
+                    self._rule_types_model.initialize_data(rule_types)
+
+            self._rules_model.initialize_data(validation_rules)
+        finally:
+            self.setUpdatesEnabled(restore_updates)
 
     def get_active_rules(self):
         """
@@ -452,29 +557,44 @@ class ValidationWidget(SGQWidget):
         :rtype: list<ValidationRule>
         """
 
-        rules = []
+        return list(self.iter_active_rules())
 
-        src_model = self._rules_proxy_model.sourceModel()
-        for proxy_row in range(self._rules_proxy_model.rowCount()):
-            proxy_index = self._rules_proxy_model.index(proxy_row, 0)
-            src_index = self._rules_proxy_model.mapToSource(proxy_index)
+    def iter_active_rules(self):
+        """
+        Iterate over the validation rules that are currently active.
 
-            rule = src_index.data(ValidationRuleModel.RULE_ITEM_ROLE)
-            if rule:
-                rules.append(rule)
+        See `get_active_rules` for more details. The rules are read from the view as they are iterated, the
+        view must not be modified (e.g. by validating a rule) while iterating; use `get_active_rules` to
+        get the rules to operate on.
 
-            # Check if the source index has children
-            src_model_item = src_model.itemFromIndex(src_index)
-            child_rows = src_model_item.rowCount()
-            for child_row in range(child_rows):
-                child_item = src_model_item.child(child_row)
-                # Need to check that child is visible (proxy model has accepted it)
-                if self._rules_proxy_model.filterAcceptsRow(child_row, src_index):
-                    rule = child_item.data(ValidationRuleModel.RULE_ITEM_ROLE)
-                    if rule:
-                        rules.append(rule)
+        :return: An iterator over the validation rules.
+        :rtype: Iterator[ValidationRule]
+        """
+
+        # Bind the lookups used for each row to locals
+        role = ValidationRuleModel.RULE_ITEM_ROLE
+        proxy = self._rules_proxy_model
+        proxy_index_fn = proxy.index
+        row_count_fn = proxy.rowCount
+
+        # Walk the proxy model, its rows are the rules that have already been accepted by the filter
+        for proxy_row in range(row_count_fn()):
+            proxy_index = proxy_index_fn(proxy_row, 0)
+
+            rule = proxy_index.data(role)
+            if rule:
+                # Rule items do not have children, only the group items need their row count
+                yield rule
+                continue
 
-        return rules
+            # Yield the visible children of the group index
+            yield from filter(
+                None,
+                (
+                    proxy_index_fn(child_row, 0, proxy_index).data(role)
+                    for child_row in range(row_count_fn(proxy_index))
+                ),
+            )
 
     def show_validation_error(self, show=True, text=None):
         """
@@ -541,6 +661,77 @@ class ValidationWidget(SGQWidget):
     ######################################################################################################
     # Protected methods
 
+    def _restore_state(self, settings_manager):
+        """
+        Restore the widget state from the settings.
+
+        :param settings_manager: The Toolkit settings object to restore the widget settings to.
+        :type settings_manager: UserSettings
+        """
+
+        # Restore the filter menu state
+        menu_state = settings_manager.retrieve(self.SETTINGS_FILTER_MENU_STATE, None)
+        if not menu_state:
+            menu_state = {
+                "{role}.data_type".format(role=ValidationRuleModel.RULE_ITEM_ROLE): {},
+                "{role}.required".format(role=ValidationRuleModel.RULE_ITEM_ROLE): {},
+            }
+        self._filter_menu.restore_state(menu_state)
+
+        self.view_mode = settings_manager.retrieve(
+            self.SETTINGS_VIEW_MODE, self.VIEW_MODE_GROUPED
+        )
+
+        show_only_errors = settings_manager.retrieve(
+            self.SETTINGS_SHOW_ONLY_ERRORS, False
+        )
+        self._toggle_errors(show_only_errors)
+
+        show_details = settings_manager.retrieve(
+            self.SETTINGS_DETAILS_VISIBILITY, False
+        )
+        self._show_details(show_details)
+
+        if self._rule_type_filter_on:
+            rule_type_id = settings_manager.retrieve(
+                self.SETTINGS_SELECTED_RULE_TYPE_ID,
+                ValidationRuleType.RULE_TYPE_NONE,
+            )
+            rule_type_item = self._rule_types_model.get_item_for_rule_type(rule_type_id)
+            if rule_type_item:
+                rule_type_index = rule_type_item.index()
+            else:
+                rule_type_index = self._rule_types_model.index(0, 0)
+
+            # Only select the rule type if it is not already the selection, since changing the selection
+            # filters the rules view
+            selection_model = self._rule_types_view.selectionModel()
+            if selection_model.selectedIndexes() != [rule_type_index]:
+                selection_model.select(
+                    rule_type_index,
+                    QtGui.QItemSelectionModel.ClearAndSelect
+                    | QtGui.QItemSelectionModel.Current,
+                )
+
+        auto_refresh = settings_manager.retrieve(
+            self.SETTINGS_AUTO_REFRESH, self.__auto_refresh
+        )
+        self._auto_refresh_option_action.setChecked(auto_refresh)
+        self._on_toggle_auto_refresh(auto_refresh)
+
+        splitter_state = settings_manager.retrieve(
+            self.SETTINGS_VIEW_DETAILS_SPLITTER_STATE, None
+        )
+        if splitter_state:
+            self._view_details_splitter.restoreState(splitter_state)
+            if self._details_widget is None:
+                # Restore the state again once the details widget is created, to restore its size
+                self._details_splitter_state = splitter_state
+        self._stored_splitter_state = splitter_state
+
+        # Must set the splitter collapsible property after the state is restored, or else this property is overwritten
+        self._view_details_splitter.setChildrenCollapsible(False)
+
     def _setup_models(self):
         """
         Set up the models for the widget.
@@ -601,8 +792,14 @@ class ValidationWidget(SGQWidget):
         self._rules_delegate = self._create_rules_delegate()
         self._view_overlay_widget = ShotGridOverlayWidget(self._rules_view)
 
-        self._details_widget = ValidationDetailsWidget(self._view_details_splitter)
-        self._details_overlay_widget = ShotGridOverlayWidget(self._details_widget)
+        # The details widget is created the first time it is shown, see _ensure_details_widget
+        self._details_widget = None
+        self._details_overlay_widget = None
+        # The message currently shown by the details overlay widget, see _set_details
+        self._details_overlay_message = None
+        self._details_splitter_state = None
+        # The splitter state last restored from, or stored to, the settings
+        self._stored_splitter_state = None
 
         # Place the splitter in a container widget so that the left hand rule types widget and the splitter
         # widget vertically align
@@ -623,7 +820,7 @@ class ValidationWidget(SGQWidget):
         # Top toolbar
 
         # Set up the refresh button menu
-        reset_action = QtGui.QAction(SGQIcon.refresh(), "Reset", self)
+        reset_action = QtGui.QAction(self._get_icon("refresh"), "Reset", self)
         reset_action.setToolTip("Reset the validation state")
         reset_action.triggered.connect(self.reset_event)
         self._auto_refresh_option_action = QtGui.QAction("Turn On Auto-Refresh", self)
@@ -641,7 +838,7 @@ class ValidationWidget(SGQWidget):
         )
         self.reset_btn = SGQToolButton()
         self.reset_btn.setObjectName("reset_btn")
-        self.reset_btn.setIcon(SGQIcon.refresh())
+        self.reset_btn.setIcon(self._get_icon("refresh"))
         self.reset_btn.setCheckable(True)
         self.reset_btn.setMenu(reset_menu_btn)
         self.reset_btn.setPopupMode(QtGui.QToolButton.MenuButtonPopup)
@@ -652,26 +849,28 @@ class ValidationWidget(SGQWidget):
         self.__warning_widget = SGQWidget(
             self,
             child_widgets=[
-                SGQToolButton(self, SGQIcon.validation_warning()),
+                SGQToolButton(self, self._get_icon("validation_warning")),
                 self.__warning_label,
             ],
         )
         self.__warning_widget.hide()
 
         # List view mode button
-        self._view_mode_list_button = SGQToolButton(self, icon=SGQIcon.list_view_mode())
+        self._view_mode_list_button = SGQToolButton(
+            self, icon=self._get_icon("list_view_mode")
+        )
         self._view_mode_list_button.setObjectName("view_mode_list_button")
         self._view_mode_list_button.setToolTip("Compact List View")
 
         # Grouped view mode button
         self._view_mode_grouped_button = SGQToolButton(
-            self, icon=SGQIcon.grid_view_mode()
+            self, icon=self._get_icon("grid_view_mode")
         )
         self._view_mode_grouped_button.setObjectName("view_mode_grouped_button")
         self._view_mode_grouped_button.setToolTip("Grouped View")
 
         # Error view mode button
-        self._errors_toggle = SGQToolButton(self, icon=SGQIcon.toggle())
+        self._errors_toggle = SGQToolButton(self, icon=self._get_icon("toggle"))
         self._errors_toggle.setObjectName("errors_toggle")
         self._errors_toggle.setToolButtonStyle(QtCore.Qt.ToolButtonTextBesideIcon)
         self._errors_toggle.setText("  Only show validation errors")
@@ -683,13 +882,32 @@ class ValidationWidget(SGQWidget):
         self._errors_label = SGQLabel(self)
 
         # Details button
-        self._details_button = SGQToolButton(self, icon=SGQIcon.info())
+        self._details_button = SGQToolButton(self, icon=self._get_icon("info"))
         self._details_button.setToolTip("Show/Hide Details Panel")
 
+        # The last rules view index and its model item, see _get_rule_model_item
+        self._rule_model_item_cache = None
+
+        # Context menu for the rules, created once and reused. The toggle details action is owned by the
+        # widget such that it is not deleted when the menu is cleared.
+        self._rules_context_menu = SGQMenu(self)
+        self._toggle_details_action = QtGui.QAction(self)
+
         # Filter text search bar
         self._search_text_widget = SearchWidget(self)
         self._search_text_widget.setMaximumWidth(150)
 
+        # Apply the search text filter once the text has not been edited for a short time, instead of on
+        # each key press
+        self._search_filter_timer = QtCore.QTimer(self)
+        self._search_filter_timer.setSingleShot(True)
+        self._search_filter_timer.setInterval(self.SEARCH_FILTER_DELAY)
+
+        # Update the rules view overlay once after the rules models change, instead of on each reset
+        self._view_overlay_update_timer = QtCore.QTimer(self)
+        self._view_overlay_update_timer.setSingleShot(True)
+        self._view_overlay_update_timer.setInterval(self.VIEW_OVERLAY_UPDATE_DELAY)
+
         # Filter menu
         self._filter_menu = FilterMenu(self, refresh_on_show=False)
         self._filter_menu.set_filter_roles(
@@ -704,6 +922,8 @@ class ValidationWidget(SGQWidget):
             ]
         )
         self._filter_menu.set_filter_model(self._rules_proxy_model)
+        # Flag indicating if the filter menu has been refreshed with rules data, see _refresh_filter_menu
+        self._filter_menu_has_data = False
 
         # Filter menu button
         self._filter_menu_button = FilterMenuButton()
@@ -800,6 +1020,52 @@ class ValidationWidget(SGQWidget):
             ]
         )
 
+    def _refresh_filter_menu(self, force=False):
+        """
+        Refresh the filter menu to reflect the current rules data.
+
+        The filter menu is not refreshed while there are no rules, and it has not been refreshed with rules
+        data before, since there would be nothing to build the filters from.
+
+        :param force: True will force the filter menu to rebuild its filters.
+        :type force: bool
+        """
+
+        has_data = self._rules_model.rowCount() > 0
+        if not has_data and not self._filter_menu_has_data:
+            return
+
+        self._filter_menu.refresh(force=force)
+        self._filter_menu_has_data = has_data
+
+    def _ensure_details_widget(self):
+        """
+        Create the details widget and connect its signals, if not already created.
+        """
+
+        if self._details_widget is not None:
+            return
+
+        self._details_widget = ValidationDetailsWidget(self._view_details_splitter)
+        self._details_widget.show_description = self._view_mode == self.VIEW_MODE_LIST
+        self._details_overlay_widget = ShotGridOverlayWidget(self._details_widget)
+        self._view_details_splitter.addWidget(self._details_widget)
+
+        if self._details_splitter_state is not None:
+            self._view_details_splitter.restoreState(self._details_splitter_state)
+            self._details_splitter_state = None
+
+        self._details_widget.request_validate_data.connect(
+            self._on_details_request_validate_data
+        )
+        self._details_widget.request_fix_data.connect(self.on_fix_rules)
+        self._details_widget.about_to_execute_action.connect(
+            self.details_about_to_execute_action
+        )
+        self._details_widget.execute_action_finished.connect(
+            self.details_execute_action_finished
+        )
+
     def _connect_signals(self):
         """
         Set up and connect signal slots between widgets.
@@ -810,17 +1076,18 @@ class ValidationWidget(SGQWidget):
         # -----------------------------------------------------
         # Button signals
         #
-        self._view_mode_list_button.clicked.connect(
-            lambda checked=None: self._set_view_mode(self.VIEW_MODE_LIST)
-        )
+        self._view_mode_list_button.clicked.connect(self._on_view_mode_list_clicked)
         self._view_mode_grouped_button.clicked.connect(
-            lambda checked=None: self._set_view_mode(self.VIEW_MODE_GROUPED)
+            self._on_view_mode_grouped_clicked
         )
-        self._details_button.clicked.connect(
-            lambda checked=None: self._show_details(checked)
+        self._details_button.clicked.connect(self._on_details_clicked)
+        self._toggle_details_action.triggered.connect(
+            self._on_toggle_details_action_triggered
         )
-        self._errors_toggle.clicked.connect(lambda checked=None: self._toggle_errors())
+        self._errors_toggle.clicked.connect(self._on_errors_toggle_clicked)
         self._search_text_widget.search_edited.connect(self._on_search_text_changed)
+        self._search_filter_timer.timeout.connect(self._apply_search_text_filter)
+        self._view_overlay_update_timer.timeout.connect(self._update_view_overlay)
 
         # -----------------------------------------------------
         # Rule types view signals
@@ -843,7 +1110,7 @@ class ValidationWidget(SGQWidget):
         # -----------------------------------------------------
         # Rules types model signals
         #
-        self._rule_types_model.modelReset.connect(self._rule_types_view.updateGeometry)
+        # NOTE the modelReset signal is connected to the view updateGeometry in turn_on_rule_type_filter
         self._rule_types_model.rule_type_check_state_changed.connect(
             self._on_rule_type_check_state_changed
         )
@@ -861,20 +1128,6 @@ class ValidationWidget(SGQWidget):
         #
         self._rules_proxy_model.layoutChanged.connect(self._on_rules_proxy_model_reset)
 
-        # -----------------------------------------------------
-        # Details widget signals
-        #
-        self._details_widget.request_validate_data.connect(
-            lambda rule: self.on_validate_rules(rule, refresh_details=True)
-        )
-        self._details_widget.request_fix_data.connect(self.on_fix_rules)
-        self._details_widget.about_to_execute_action.connect(
-            self.details_about_to_execute_action
-        )
-        self._details_widget.execute_action_finished.connect(
-            self.details_execute_action_finished
-        )
-
         # -----------------------------------------------------
         # Button clicked signals
         #
@@ -895,29 +1148,24 @@ class ValidationWidget(SGQWidget):
         delegate.item_padding = ViewItemDelegate.Padding(4, 4, 0, 4)
         delegate.separator_role = ValidationRuleTypeModel.VIEW_ITEM_SEPARATOR_ROLE
 
+        # Cache the action data, it only changes with the model data
+        self._rule_types_action_data_cache = _ActionDataCache(
+            self._rule_types_view.model()
+        )
+        cached = self._rule_types_action_data_cache.wrap
+
         delegate.add_action(
-            {
-                "type": ViewItemAction.TYPE_ICON,
-                "show_always": True,
-                "get_data": get_rule_type_icon_data,
-            },
+            dict(_ICON_ACTION, get_data=cached(get_rule_type_icon_data)),
             ViewItemDelegate.LEFT,
         )
         delegate.add_actions(
             [
-                {
-                    "type": ViewItemAction.TYPE_CHECK_BOX,
-                    "show_always": True,
-                    "padding_right": 24,
-                    "padding_top": 0,
-                    "padding_bottom": 0,
-                    "get_data": get_rule_type_checkbox_data,
-                },
-                {
-                    "type": ViewItemAction.TYPE_ICON,
-                    "show_always": True,
-                    "get_data": get_rule_type_status_icon_data,
-                },
+                dict(
+                    _CHECK_BOX_ACTION,
+                    padding_right=24,
+                    get_data=cached(get_rule_type_checkbox_data),
+                ),
+                dict(_ICON_ACTION, get_data=cached(get_rule_type_status_icon_data)),
             ],
             ViewItemDelegate.RIGHT,
         )
@@ -932,7 +1180,11 @@ class ValidationWidget(SGQWidget):
 
         assert self._rules_view, "The rules view must be created before the delegate"
 
-        delegate = ViewItemDelegate(self._rules_view)
+        # The size hint cache key is set by the view mode, see _set_view_mode
+        delegate = SizeHintCacheDelegate(self._rules_view)
+        connect_model_changed(
+            self._rules_view.model(), delegate.clear_size_hint_cache, data_changed=False
+        )
         delegate.text_rect_valign = ViewItemDelegate.CENTER
         delegate.elide_text = False
         delegate.elide_header = True
@@ -944,69 +1196,65 @@ class ValidationWidget(SGQWidget):
         delegate.expand_role = ValidationRuleModel.VIEW_ITEM_EXPAND_ROLE
         delegate.text_role = ValidationRuleModel.VIEW_ITEM_TEXT_ROLE
 
+        # Cache the action data, it only changes with the model data. The expand action data is not cached
+        # since it depends on the view expanded state
+        self._rules_action_data_cache = _ActionDataCache(self._rules_view.model())
+        # The rule actions data is provided by a single callback, called once per row
+        cached_row = self._rules_action_data_cache.wrap_key
+
         delegate.add_action(
             {
                 "type": ViewItemAction.TYPE_PUSH_BUTTON,
-                "icon": SGQIcon.tree_arrow(),
+                "icon": self._get_icon("tree_arrow"),
                 "show_always": True,
                 "features": QtGui.QStyleOptionButton.Flat,
                 "get_data": get_expand_action_data,
-                "callback": lambda view, index, pos: view.toggle_expand(index),
+                "callback": expand_action_callback,
             },
             ViewItemDelegate.LEFT,
         )
         delegate.add_actions(
             [
-                {
-                    "type": ViewItemAction.TYPE_CHECK_BOX,
-                    "show_always": True,
-                    "padding_top": 0,
-                    "padding_bottom": 0,
-                    "padding_right": 0,
-                    "get_data": get_rule_optional_data,
-                },
-                {
-                    "type": ViewItemAction.TYPE_CHECK_BOX,
-                    "check_state_role": ValidationRuleModel.RULE_MANUAL_CHECK_STATE_ROLE,
-                    "show_always": True,
-                    "padding_top": 0,
-                    "padding_bottom": 0,
-                    "padding_right": 14,
-                    "get_data": get_rule_manual_data,
-                },
-                {
-                    "type": ViewItemAction.TYPE_PUSH_BUTTON,
-                    "name": "...",
-                    "padding_left": 4,
-                    "padding_right": 4,
-                    "padding": 2,
-                    "get_data": get_rule_show_actions_data,
-                    "callback": self.rule_show_actions_callback,
-                },
-                {
-                    "type": ViewItemAction.TYPE_PUSH_BUTTON,
-                    "padding": 2,
-                    "get_data": get_rule_fix_action_data,
-                    "callback": self.rule_fix_action_callback,
-                },
-                {
-                    "type": ViewItemAction.TYPE_PUSH_BUTTON,
-                    "padding": 2,
-                    "get_data": get_rule_check_action_data,
-                    "callback": self.rule_check_action_callback,
-                },
+                dict(
+                    _CHECK_BOX_ACTION,
+                    padding_right=0,
+                    get_data=cached_row(get_rule_row_data, "optional"),
+                ),
+                dict(
+                    _CHECK_BOX_ACTION,
+                    check_state_role=ValidationRuleModel.RULE_MANUAL_CHECK_STATE_ROLE,
+                    padding_right=14,
+                    get_data=cached_row(get_rule_row_data, "manual"),
+                ),
+                dict(
+                    _PUSH_BUTTON_ACTION,
+                    name="...",
+                    padding_left=4,
+                    padding_right=4,
+                    get_data=cached_row(get_rule_row_data, "show_actions"),
+                    callback=self.rule_show_actions_callback,
+                ),
+                dict(
+                    _PUSH_BUTTON_ACTION,
+                    get_data=cached_row(get_rule_row_data, "fix"),
+                    callback=self.rule_fix_action_callback,
+                ),
+                dict(
+                    _PUSH_BUTTON_ACTION,
+                    get_data=cached_row(get_rule_row_data, "check"),
+                    callback=self.rule_check_action_callback,
+                ),
             ],
             ViewItemDelegate.FLOAT_TOP_RIGHT,
         )
         delegate.add_actions(
             [
-                {
-                    "type": ViewItemAction.TYPE_ICON,
-                    "icon_size": QtCore.QSize(20, 20),
-                    "show_always": True,
-                    "padding": 2,
-                    "get_data": get_rule_status_action_data,
-                },
+                dict(
+                    _ICON_ACTION,
+                    icon_size=QtCore.QSize(20, 20),
+                    padding=2,
+                    get_data=cached_row(get_rule_row_data, "status"),
+                ),
             ],
             ViewItemDelegate.LEFT,
         )
@@ -1014,7 +1262,7 @@ class ValidationWidget(SGQWidget):
         self._rules_view.setItemDelegate(delegate)
         return delegate
 
-    def _set_view_mode(self, view_mode):
+    def _set_view_mode(self, view_mode, force=False):
         """
         Set the current view mode for the main validation rules view.
 
@@ -1023,8 +1271,19 @@ class ValidationWidget(SGQWidget):
                 VIEW_MODE_LIST - a flat list view
                 VIEW_MODE_GROUPED - a grouped list view
         :type view_mode: int
+        :param force: True will apply the view mode even if it is the current view mode.
+        :type force: bool
         """
 
+        if view_mode == self._view_mode and not force:
+            # Avoid re-applying the view mode to the model, view and delegate when it has not changed.
+            # Only restore the button check states, e.g. when the current view mode button is clicked.
+            self._view_mode_list_button.setChecked(view_mode == self.VIEW_MODE_LIST)
+            self._view_mode_grouped_button.setChecked(
+                view_mode == self.VIEW_MODE_GROUPED
+            )
+            return
+
         self._view_mode = view_mode
 
         if view_mode == self.VIEW_MODE_LIST:
@@ -1032,22 +1291,28 @@ class ValidationWidget(SGQWidget):
             self._view_mode_grouped_button.setChecked(False)
             self._rules_model.hierarchical = False
             self._rules_view.group_spacing = 30
-            self._details_widget.show_description = True
+            if self._details_widget is not None:
+                self._details_widget.show_description = True
 
             self._rules_delegate.text_padding = ViewItemDelegate.Padding(8, 10, 8, 10)
             self._rules_delegate.action_item_margin = 4
             self._rules_delegate.visible_lines = 1
+            # The rule rows display a single line of text, they all have the same size
+            self._rules_delegate.size_hint_key = get_rule_list_size_hint_key
 
         elif view_mode == self.VIEW_MODE_GROUPED:
             self._view_mode_grouped_button.setChecked(True)
             self._view_mode_list_button.setChecked(False)
             self._rules_model.hierarchical = True
             self._rules_view.group_spacing = 4
-            self._details_widget.show_description = False
+            if self._details_widget is not None:
+                self._details_widget.show_description = False
 
             self._rules_delegate.visible_lines = -1
             self._rules_delegate.text_padding = ViewItemDelegate.Padding(10, 10, 10, 10)
             self._rules_delegate.action_item_margin = 7
+            # The rule rows display all text lines, their sizes vary
+            self._rules_delegate.size_hint_key = None
 
         else:
             assert False, "Unsupported view mode"
@@ -1074,10 +1339,17 @@ class ValidationWidget(SGQWidget):
             # Set the visibility explicitly
             self._details_button.setChecked(show)
 
+        if show:
+            self._ensure_details_widget()
+        elif self._details_widget is None:
+            # Nothing to hide
+            return
+
         self._details_widget.setVisible(show)
+        self._details_shown = show
 
         if show:
-            indexes = self._rules_view.selectionModel().selectedIndexes()
+            indexes = self._rules_view.selectionModel().selectedRows()
             self._set_details(indexes)
 
     def _set_details(self, selected_indexes):
@@ -1088,32 +1360,38 @@ class ValidationWidget(SGQWidget):
         :type selected_indexes: list<QtGui.QModelIndex>
         """
 
+        if not self._details_shown:
+            # The details are set from the current selection when the widget is shown
+            return
+
+        rule = None
         if not selected_indexes:
-            self._details_overlay_widget.show_message(
-                "Select a Validation Rule to see more details."
-            )
+            message = "Select a Validation Rule to see more details."
         elif len(selected_indexes) > 1:
-            self._details_overlay_widget.show_message(
-                "Select a Validation Rule to see details."
-            )
+            message = "Select a Validation Rule to see details."
         else:
-            self._details_overlay_widget.hide()
-            model_index = selected_indexes[0]
-            rule = model_index.data(ValidationRuleModel.RULE_ITEM_ROLE)
-            if not rule:
-                # Do not show details for group items
-                self._details_overlay_widget.show_message(
-                    "Select a Validation Rule to see more details."
-                )
+            rule = selected_indexes[0].data(ValidationRuleModel.RULE_ITEM_ROLE)
+            # Do not show details for group items
+            message = None if rule else "Select a Validation Rule to see more details."
+
+        # Only update the overlay when its message changes, the selection changes often
+        if message != self._details_overlay_message:
+            if message is None:
+                self._details_overlay_widget.hide()
             else:
-                self._details_widget.set_data(rule)
+                self._details_overlay_widget.show_message(message)
+            self._details_overlay_message = message
+
+        if rule:
+            # Defer the refresh, the selection changes often (e.g. when moving through the rules list)
+            self._details_widget.set_data(rule, deferred=True)
 
     def _refresh_details(self, rule=None):
         """
         Refresh the details widget to reflect the latest changes to the data.
         """
 
-        if not self._details_on or not self._details_widget.isVisible():
+        if not self._details_shown:
             return
 
         if (
@@ -1125,12 +1403,28 @@ class ValidationWidget(SGQWidget):
 
         self._details_widget.refresh()
 
-    def _update_errors(self):
+    def _update_errors(self, rule_item=None):
         """
         Update the errors label text to indicated how many errors ther are currently.
+
+        :param rule_item: If given, only the error status of this rule model item is updated, instead of
+            checking all the rules in the model.
+        :type rule_item: ValidationRuleModel.ValidationRuleModelItem
         """
 
-        num_errors = len(self._rules_model.get_errors())
+        if rule_item is None:
+            self._error_rule_ids = {
+                item.data(ValidationRuleModel.RULE_ITEM_ID_ROLE)
+                for item in self._rules_model.get_errors()
+            }
+        else:
+            rule_id = rule_item.data(ValidationRuleModel.RULE_ITEM_ID_ROLE)
+            if rule_item.data(ValidationRuleModel.RULE_HAS_ERROR_ROLE):
+                self._error_rule_ids.add(rule_id)
+            else:
+                self._error_rule_ids.discard(rule_id)
+
+        num_errors = len(self._error_rule_ids)
         if num_errors:
             self._errors_label.setText(
                 "{} issue{} found    ".format(num_errors, "s" if num_errors > 1 else "")
@@ -1219,52 +1513,86 @@ class ValidationWidget(SGQWidget):
         if not indexes:
             selection_model = self._rules_view.selectionModel()
             if selection_model:
-                indexes = selection_model.selectedIndexes()
+                indexes = selection_model.selectedRows()
 
         # A single index must be selected
         if not indexes or len(indexes) > 1:
             return
 
         # Get the actions for this index
-        src_index = _ensure_source_index(indexes[0])
-        rule_model_item = src_index.model().itemFromIndex(src_index)
-        rule_actions = rule_model_item.data(ValidationRuleModel.RULE_ACTIONS_ROLE)
-        actions = []
-        for rule_action in rule_actions:
-            callback = rule_action.get("callback")
-            if not callback:
-                continue
+        rule_model_item = self._get_rule_model_item(indexes[0])
+        rule_actions = rule_model_item.data(
+            ValidationRuleModel.RULE_CALLABLE_ACTIONS_ROLE
+        )
 
-            rule = rule_model_item.data(ValidationRuleModel.RULE_ITEM_ROLE)
-            kwargs = rule_action.get("kwargs", {})
-            kwargs["errors"] = (
-                rule.get_errors() if self.pre_validate_before_actions else rule.errors
-            )
+        # Clear the actions from the previous time the menu was shown. The menu owns the rule actions,
+        # they are deleted when cleared.
+        menu = self._rules_context_menu
+        menu.clear()
 
-            action = QtGui.QAction(rule_action["name"])
-            action.triggered.connect(
-                lambda fn=callback, k=kwargs: self.__execute_menu_action(
-                    rule_action, fn, k
+        if rule_actions:
+            # The rule errors are only retrieved when an action is triggered, since pre-validating runs
+            # the rule check function
+            rule = rule_model_item.data(ValidationRuleModel.RULE_ITEM_ROLE)
+            for rule_action in rule_actions:
+                action = menu.addAction(rule_action["name"])
+                action.triggered.connect(
+                    partial(self._execute_rule_menu_action, rule, rule_action)
                 )
-            )
-            actions.append(action)
 
         # Add action to show details for the item that the context menu is shown for.
-        is_details_visible = self._details_widget.isVisible()
-        toggle_details_action = QtGui.QAction(
-            "Hide Details" if is_details_visible else "Show Details"
+        self._toggle_details_action.setText(
+            "Hide Details" if self._details_shown else "Show Details"
         )
-        toggle_details_action.triggered.connect(
-            lambda: self._show_details(show=not is_details_visible)
-        )
-        actions.append(toggle_details_action)
+        menu.addAction(self._toggle_details_action)
 
-        # Create the menu, add the actions and show it
-        menu = SGQMenu(self)
-        menu.addActions(actions)
+        # Show the menu
         pos = widget.mapToGlobal(pos)
         menu.exec_(pos)
 
+    def _get_rule_model_item(self, index):
+        """
+        Get the rules model item for the given rules view index.
+
+        The item for the last index is cached, since the context menu is often shown repeatedly for the same
+        index. The cached item is cleared when the rules model is reset.
+
+        :param index: The rules view index to get the model item for.
+        :type index: QtGui.QModelIndex
+
+        :return: The rules model item.
+        :rtype: QtGui.QStandardItem
+        """
+
+        if self._rule_model_item_cache is not None:
+            persistent_index, model_item = self._rule_model_item_cache
+            if persistent_index.isValid() and persistent_index == index:
+                return model_item
+
+        src_index = _ensure_source_index(index)
+        model_item = src_index.model().itemFromIndex(src_index)
+        self._rule_model_item_cache = (QtCore.QPersistentModelIndex(index), model_item)
+        return model_item
+
+    def _execute_rule_menu_action(self, rule, rule_action, checked=False):
+        """
+        Execute the rule action triggered from the context menu.
+
+        :param rule: The rule to execute the action for.
+        :type rule: ValidationRule
+        :param rule_action: The rule action to execute.
+        :type rule_action: dict
+        :param checked: True if the menu action is checked, else False. Not used.
+        :type checked: bool
+        """
+
+        self.__execute_menu_action(
+            rule_action,
+            rule_action["callback"],
+            rule_action.get("kwargs", {}),
+            rule=rule,
+        )
+
     @sgtk.LogManager.log_timing
     def _validate_rules(self, rules, refresh_details=False):
         """
@@ -1279,13 +1607,30 @@ class ValidationWidget(SGQWidget):
         if not isinstance(rules, list):
             rules = [rules]
 
-        for rule in rules:
-            self._bundle.logger.debug("Validating Rule: {}".format(rule.name))
-            self.validate_rule_begin(rule)
-            rule.exec_check()
-            self.validate_rule_finished(rule, update_rule_type=False)
-
-        if refresh_details:
+        # Update the view once after validating multiple rules, instead of after each rule
+        batch = len(rules) > 1
+        restore_updates = self._rules_view.updatesEnabled()
+        if batch:
+            # Do not repaint the rules view while the rules are processed
+            self._rules_view.setUpdatesEnabled(False)
+        self._is_processing_batch = batch
+        try:
+            for rule in rules:
+                self._bundle.logger.debug("Validating Rule: {}".format(rule.name))
+                self.validate_rule_begin(rule)
+                rule.exec_check()
+                self.validate_rule_finished(rule, update_rule_type=False)
+        finally:
+            self._is_processing_batch = False
+            self._rules_view.setUpdatesEnabled(restore_updates)
+            if batch:
+                # Update the view for the rules validated so far, even if a rule raised a fatal error
+                self._rules_model.emit_all_data_changed()
+                self._rules_proxy_model._update()
+                self._update_errors()
+                self._refresh_details()
+
+        if refresh_details and not batch:
             # Refresh the details since its data may have changed
             self._refresh_details()
 
@@ -1305,11 +1650,25 @@ class ValidationWidget(SGQWidget):
         if not isinstance(rules, list):
             rules = [rules]
 
-        for rule in rules:
-            self._bundle.logger.debug("Resolving Rule: {}".format(rule.name))
-            self.fix_rule_begin(rule)
-            rule.exec_fix()
-            self.fix_rule_finished(rule)
+        # Update the view once after fixing multiple rules, instead of after each rule
+        batch = len(rules) > 1
+        restore_updates = self._rules_view.updatesEnabled()
+        if batch:
+            # Do not repaint the rules view while the rules are processed
+            self._rules_view.setUpdatesEnabled(False)
+        self._is_processing_batch = batch
+        try:
+            for rule in rules:
+                self._bundle.logger.debug("Resolving Rule: {}".format(rule.name))
+                self.fix_rule_begin(rule)
+                rule.exec_fix()
+                self.fix_rule_finished(rule)
+        finally:
+            self._is_processing_batch = False
+            self._rules_view.setUpdatesEnabled(restore_updates)
+            if batch:
+                # Update the view for the rules fixed so far, even if a rule raised a fatal error
+                self._rules_model.emit_all_data_changed()
 
     def _update_view_overlay(self):
         """Update the main rules view overlay widget."""
@@ -1330,14 +1689,8 @@ class ValidationWidget(SGQWidget):
                 else:
                     num_errors = len(self._rules_model.get_errors())
                     if num_errors <= 0:
-                        icon = SGQIcon.validation_ok(size=SGQIcon.SIZE_40x40)
-                        details_text = "<br/>".join(
-                            [
-                                "<span style='font-size:24px; color:#309AFF;'>Awesome work!</span>",
-                                "",
-                                "<span style='font-size:14px;'>Success! No errors found. You're ready to publish.</span>",
-                            ]
-                        )
+                        icon = self._get_icon("validation_ok", size=SGQIcon.SIZE_40x40)
+                        details_text = _NO_ERRORS_DETAILS_TEXT
                     else:
                         # There are errors but they are hidden by the current filters.
                         title = "No results. Clear filters to view data."
@@ -1461,7 +1814,7 @@ class ValidationWidget(SGQWidget):
 
         self._update_progress(rule, True)
 
-        if not rule or self._is_validating_all:
+        if not rule or self._is_validating_all or self._is_processing_batch:
             # Do not process the individual rule after validation if there is not rule, or all rules are
             # being validated at once
             return
@@ -1483,13 +1836,13 @@ class ValidationWidget(SGQWidget):
                 updated = True
 
         if not updated:
-            rule_item.emitDataChanged()
+            self._rules_model.emit_rule_state_changed(rule_item)
 
         # Update the proxy model to reflect any changes after validation
         self._rules_proxy_model._update()
 
-        # Update the errors label to reflect any changes after validation
-        self._update_errors()
+        # Update the errors label to reflect any changes after validating the rule
+        self._update_errors(rule_item)
 
         self._refresh_details(rule)
 
@@ -1615,12 +1968,16 @@ class ValidationWidget(SGQWidget):
         # Update the progress bar after a rule has finished fixing
         self._update_progress(rule, True)
 
+        if self._is_processing_batch:
+            # The view is updated once the batch of rules has been fixed
+            return
+
         rule_item = self._rules_model.get_item_for_rule(rule)
         if not rule_item:
             return
 
         # The rule data may have changed, emit the data changed signal to indicate rule data updates.
-        rule_item.emitDataChanged()
+        self._rules_model.emit_rule_state_changed(rule_item)
 
     def _on_rule_item_context_menu_requested(self, pos):
         """
@@ -1647,6 +2004,15 @@ class ValidationWidget(SGQWidget):
     def _on_search_text_changed(self):
         """
         Callback triggered when the search widget text has been updated.
+
+        The text filter is applied once the text has not changed for `SEARCH_FILTER_DELAY` milliseconds.
+        """
+
+        self._search_filter_timer.start()
+
+    def _apply_search_text_filter(self):
+        """
+        Callback triggered when the search text filter should be applied to the rules.
         """
 
         search_text = self._search_text_widget._get_search_text()
@@ -1659,16 +2025,18 @@ class ValidationWidget(SGQWidget):
         Callback triggered when the rules model has been reset.
         """
 
-        self._update_view_overlay()
+        # The model items have been recreated
+        self._rule_model_item_cache = None
+        self._view_overlay_update_timer.start()
 
-        self._filter_menu.refresh(force=True)
+        self._refresh_filter_menu(force=True)
 
     def _on_rules_proxy_model_reset(self):
         """
         Callback triggered when the rules proxy model has been reset.
         """
 
-        self._update_view_overlay()
+        self._view_overlay_update_timer.start()
 
     def _on_rule_check_state_changed(self, rule, check_state):
         """
@@ -1735,9 +2103,49 @@ class ValidationWidget(SGQWidget):
         The details widget will be updated to reflect the current rule selection.
         """
 
-        indexes = self._rules_view.selectionModel().selectedIndexes()
+        if not self._details_shown:
+            # The details are set from the current selection when the widget is shown
+            return
+
+        # Get one index per selected row
+        indexes = self._rules_view.selectionModel().selectedRows()
         self._set_details(indexes)
 
+    def _on_view_mode_list_clicked(self, checked=False):
+        """Slot triggered when the list view mode button has been clicked."""
+
+        self._set_view_mode(self.VIEW_MODE_LIST)
+
+    def _on_view_mode_grouped_clicked(self, checked=False):
+        """Slot triggered when the grouped view mode button has been clicked."""
+
+        self._set_view_mode(self.VIEW_MODE_GROUPED)
+
+    def _on_details_clicked(self, checked=False):
+        """Slot triggered when the details button has been clicked."""
+
+        self._show_details(checked)
+
+    def _on_toggle_details_action_triggered(self, checked=False):
+        """Slot triggered when the context menu action to show or hide the details has been triggered."""
+
+        self._show_details(show=not self._details_shown)
+
+    def _on_errors_toggle_clicked(self, checked=False):
+        """Slot triggered when the show only errors toggle has been clicked."""
+
+        self._toggle_errors()
+
+    def _on_details_request_validate_data(self, rule):
+        """
+        Slot triggered when the details widget requests to validate a rule.
+
+        :param rule: The rule to validate.
+        :type rule: ValidationRule
+        """
+
+        self.on_validate_rules(rule, refresh_details=True)
+
     def _on_reset_clicked(self, checked=False):
         """Slot triggered when the reset button has been clicked."""
 
@@ -1774,7 +2182,7 @@ class ValidationWidget(SGQWidget):
             self._errors_toggle.setChecked(show_errors)
 
         self._rules_proxy_model.turn_on_error_filter(on=show_errors)
-        self._filter_menu.refresh()
+        self._refresh_filter_menu()
 
     ######################################################################################################
     # ViewItemDelegate callback functions
@@ -1818,9 +2226,7 @@ class ValidationWidget(SGQWidget):
         )
 
         # Get the ValidationRule objects for the index
-        rules = index.data(ValidationRuleModel.RULE_ITEM_ROLE) or index.data(
-            ValidationRuleModel.RULE_ITEMS_ROLE
-        )
+        rules = _get_index_rules(index)
 
         self.on_validate_rules(rules, refresh_details=True)
 
@@ -1842,10 +2248,8 @@ class ValidationWidget(SGQWidget):
             index, QtGui.QItemSelectionModel.ClearAndSelect
         )
 
-        # Get the ValidationRule object for the index
-        rules = index.data(ValidationRuleModel.RULE_ITEM_ROLE) or index.data(
-            ValidationRuleModel.RULE_ITEMS_ROLE
-        )
+        # Get the ValidationRule objects for the index
+        rules = _get_index_rules(index)
 
         self.on_fix_rules(rules)
 
@@ -1871,7 +2275,7 @@ def get_expand_action_data(parent, index):
     """
 
     visible = index.data(ValidationRuleModel.IS_GROUP_ITEM_ROLE)
-    state = QtGui.QStyle.State_Active | QtGui.QStyle.State_Enabled
+    state = _BASE_ACTION_STATE
 
     if parent.is_expanded(index):
         state |= QtGui.QStyle.State_Off
@@ -1881,6 +2285,23 @@ def get_expand_action_data(parent, index):
     return {"visible": visible, "state": state}
 
 
+def expand_action_callback(view, index, pos):
+    """
+    Callback function triggered by the ViewItemDelegate.
+
+    The rule group header expand action was triggered, toggle the group expanded state.
+
+    :param view: The view the index belongs to.
+    :type view: QAbstractItemView
+    :param index: The index to act on
+    :type index: :class:`sgtk.platform.qt.QtCore.QModelIndex`
+    :param pos: The mouse position captured on triggered this callback
+    :type pos: :class:`sgtk.platform.qt.QtCore.QPoint`
+    """
+
+    view.toggle_expand(index)
+
+
 def get_rule_type_icon_data(parent, index):
     """
     Callback function triggered by the ViewItemDelegate.
@@ -1945,22 +2366,14 @@ def get_rule_type_checkbox_data(parent, index):
     # This action is "visible" for all to align actions in each row, but for rule types that this
     # action does not apply to, it will be hidden (but take up the space)
     visible = True
-    applicable = rule_type_id in (
-        ValidationRuleType.RULE_TYPE_MANUAL,
-        ValidationRuleType.RULE_TYPE_OPTIONAL,
-    )
+    applicable = rule_type_id in _CHECK_BOX_RULE_TYPE_IDS
 
-    state = QtGui.QStyle.State_Active | QtGui.QStyle.State_Enabled
-    if checkbox_state == QtCore.Qt.Checked:
-        state |= QtGui.QStyle.State_On
-    elif checkbox_state == QtCore.Qt.PartiallyChecked:
-        if icon:
-            # Icons cannot have a partial check state - set the state to be on
-            state |= QtGui.QStyle.State_On
-        else:
-            state |= QtGui.QStyle.State_NoChange
-    else:
-        state |= QtGui.QStyle.State_Off
+    if icon and checkbox_state == QtCore.Qt.PartiallyChecked:
+        # Icons cannot have a partial check state - set the state to be on
+        checkbox_state = QtCore.Qt.Checked
+    state = _BASE_ACTION_STATE | _CHECK_STATE_FLAG.get(
+        checkbox_state, QtGui.QStyle.State_Off
+    )
 
     return {
         "visible": visible,
@@ -1971,49 +2384,40 @@ def get_rule_type_checkbox_data(parent, index):
     }
 
 
-def get_rule_manual_data(parent, index):
+def get_rule_row_data(parent, index):
     """
     Callback function triggered by the ViewItemDelegate.
 
-    Get the data for displaying a manual rule.
+    Get the data for displaying all the rule actions for an index. The rule is retrieved once
+    for the index, and the data for each action is returned by its key: "manual", "optional",
+    "show_actions", "check", "fix" and "status".
 
     :param parent: The parent of the ViewItemDelegate which triggered this callback
     :type parent: QAbstractItemView
-    :param index: The index the action is for.
+    :param index: The index the actions are for.
     :type index: :class:`sgtk.platform.qt.QtCore.QModelIndex`
 
-    :return: The data for the action and index.
+    :return: The data for each action and index.
     :rtype: dict (see the ViewItemAction class attribute `get_data` for more details)
     """
 
     rule = index.data(ValidationRuleModel.RULE_ITEM_ROLE)
-    if not rule:
-        return {"visible": False}
-
-    if not rule.manual:
-        return {"visible": False}
-
-    checkbox_state = index.data(ValidationRuleModel.RULE_MANUAL_CHECK_STATE_ROLE)
-    state = QtGui.QStyle.State_Active | QtGui.QStyle.State_Enabled
-
-    if checkbox_state == QtCore.Qt.Checked:
-        state |= QtGui.QStyle.State_On
-    elif checkbox_state == QtCore.Qt.PartiallyChecked:
-        state |= QtGui.QStyle.State_NoChange
-    else:
-        state |= QtGui.QStyle.State_Off
 
     return {
-        "visible": True,
-        "state": state,
+        "manual": _get_rule_manual_data(index, rule),
+        "optional": _get_rule_optional_data(index, rule),
+        "show_actions": _get_rule_show_actions_data(index, rule),
+        "check": _get_rule_check_action_data(index, rule),
+        "fix": _get_rule_fix_action_data(index, rule),
+        "status": get_rule_status_action_data(parent, index),
     }
 
 
-def get_rule_optional_data(parent, index):
+def get_rule_manual_data(parent, index):
     """
     Callback function triggered by the ViewItemDelegate.
 
-    Get the data for displaying an optional rule.
+    Get the data for displaying a manual rule.
 
     :param parent: The parent of the ViewItemDelegate which triggered this callback
     :type parent: QAbstractItemView
@@ -2024,32 +2428,27 @@ def get_rule_optional_data(parent, index):
     :rtype: dict (see the ViewItemAction class attribute `get_data` for more details)
     """
 
-    rule = index.data(ValidationRuleModel.RULE_ITEM_ROLE)
-    if not rule:
-        return {"visible": False}
+    return _get_rule_manual_data(index, index.data(ValidationRuleModel.RULE_ITEM_ROLE))
 
-    if not rule.optional:
-        if rule.manual:
-            # Ensure the manual checkboxes are aligned across rows
-            return {"visible": True, "placeholder": True, "padding_left": 22}
-        return {"visible": False}
 
-    checkbox_icon = index.data(ValidationRuleModel.CHECKBOX_ICON_ROLE)
-    checkbox_state = index.data(QtCore.Qt.CheckStateRole)
-    state = QtGui.QStyle.State_Active | QtGui.QStyle.State_Enabled
+def get_rule_optional_data(parent, index):
+    """
+    Callback function triggered by the ViewItemDelegate.
 
-    if checkbox_state == QtCore.Qt.Checked:
-        state |= QtGui.QStyle.State_On
-    elif checkbox_state == QtCore.Qt.PartiallyChecked:
-        state |= QtGui.QStyle.State_NoChange
-    else:
-        state |= QtGui.QStyle.State_Off
+    Get the data for displaying an optional rule.
 
-    return {
-        "visible": True,
-        "state": state,
-        "icon": checkbox_icon,
-    }
+    :param parent: The parent of the ViewItemDelegate which triggered this callback
+    :type parent: QAbstractItemView
+    :param index: The index the action is for.
+    :type index: :class:`sgtk.platform.qt.QtCore.QModelIndex`
+
+    :return: The data for the action and index.
+    :rtype: dict (see the ViewItemAction class attribute `get_data` for more details)
+    """
+
+    return _get_rule_optional_data(
+        index, index.data(ValidationRuleModel.RULE_ITEM_ROLE)
+    )
 
 
 def get_rule_show_actions_data(parent, index):
@@ -2067,11 +2466,9 @@ def get_rule_show_actions_data(parent, index):
     :rtype: dict (see the ViewItemAction class attribute `get_data` for more details)
     """
 
-    visible = bool(index.data(ValidationRuleModel.RULE_ACTIONS_ROLE))
-
-    return {
-        "visible": visible,
-    }
+    return _get_rule_show_actions_data(
+        index, index.data(ValidationRuleModel.RULE_ITEM_ROLE)
+    )
 
 
 def get_rule_check_action_data(parent, index):
@@ -2089,21 +2486,10 @@ def get_rule_check_action_data(parent, index):
     :rtype: dict (see the ViewItemAction class attribute `get_data` for more details)
     """
 
-    name = index.data(ValidationRuleModel.RULE_CHECK_NAME_ROLE)
-    visible = index.data(ValidationRuleModel.RULE_CHECK_FUNC_ROLE) is not None or (
-        index.data(ValidationRuleModel.IS_GROUP_ITEM_ROLE)
-        and index.data(ValidationRuleModel.RULE_ITEMS_ROLE)
+    return _get_rule_check_action_data(
+        index, index.data(ValidationRuleModel.RULE_ITEM_ROLE)
     )
 
-    if name and index.data(ValidationRuleModel.RULE_VALIDATION_RAN):
-        # Modify the name to prepend "Re", e.g. Validate -> Revalidate
-        name = "Re{name}".format(name=name.lower())
-
-    return {
-        "visible": visible,
-        "name": name,
-    }
-
 
 def get_rule_fix_action_data(parent, index):
     """
@@ -2120,17 +2506,10 @@ def get_rule_fix_action_data(parent, index):
     :rtype: dict (see the ViewItemAction class attribute `get_data` for more details)
     """
 
-    name = index.data(ValidationRuleModel.RULE_FIX_NAME_ROLE)
-    visible = index.data(ValidationRuleModel.RULE_FIX_FUNC_ROLE) is not None or (
-        index.data(ValidationRuleModel.IS_GROUP_ITEM_ROLE)
-        and index.data(ValidationRuleModel.RULE_ITEMS_ROLE)
+    return _get_rule_fix_action_data(
+        index, index.data(ValidationRuleModel.RULE_ITEM_ROLE)
     )
 
-    return {
-        "visible": visible,
-        "name": name,
-    }
-
 
 def get_rule_status_action_data(parent, index):
     """
@@ -2148,18 +2527,327 @@ def get_rule_status_action_data(parent, index):
     """
 
     icon = index.data(ValidationRuleModel.RULE_STATUS_ICON_ROLE)
-    visible = icon is not None
+    if icon is None:
+        return _INVISIBLE_ACTION_DATA
 
     return {
-        "visible": visible,
+        "visible": True,
         "icon": icon,
     }
 
 
+def get_rule_list_size_hint_key(
+    index, _rule_item_role=ValidationRuleModel.IS_RULE_ITEM_ROLE
+):
+    """
+    Get the key to cache the size hint of the rule item with, in the list view mode.
+
+    The rule text is displayed on a single line in the list view mode, so all rule rows have the same
+    size. Group items are not cached.
+
+    :param index: The index of the rule item.
+    :type index: :class:`sgtk.platform.qt.QtCore.QModelIndex`
+
+    :return: The size hint cache key, or None if the size should not be cached.
+    :rtype: tuple | None
+    """
+
+    if not index.data(_rule_item_role):
+        return None
+
+    return (index.column(), True)
+
+
 #############################################################################################################
 # Helper functions
 
 
+class _ActionDataCache:
+    """
+    Cache the data returned by the ViewItemDelegate action get_data callbacks.
+
+    The delegate requests the action data each time an item is painted or sized. The data is cached per row
+    for all the callbacks. The cached data for the changed rows, and their parents, is cleared when the model
+    data changes, and all cached data is cleared when the model layout changes. Only get_data callbacks that
+    depend solely on the model data should be cached.
+    """
+
+    def __init__(self, model):
+        """
+        Create the cache for the given model.
+
+        :param model: The model that the view, which the delegate is used for, displays.
+        :type model: QtCore.QAbstractItemModel
+        """
+
+        self._cache = {}
+
+        # Changed rows are evicted individually, all other changes clear the whole cache
+        model.dataChanged.connect(self._on_data_changed)
+        connect_model_changed(model, self.clear, data_changed=False)
+
+    def clear(self, *args, **kwargs):
+        """
+        Clear the cached action data.
+
+        This method accepts any arguments, see `connect_model_changed`.
+        """
+
+        self._cache.clear()
+
+    def wrap(self, get_data):
+        """
+        Return a get_data callback that caches the data returned by the given callback.
+
+        :param get_data: The get_data callback to cache the data for.
+        :type get_data: function
+
+        :return: The caching get_data callback.
+        :rtype: function
+        """
+
+        def cached_get_data(parent, index):
+            # Return a copy so that the cached data cannot be modified
+            return dict(self._get_data(get_data, parent, index))
+
+        return cached_get_data
+
+    def wrap_key(self, get_row_data, key):
+        """
+        Return a get_data callback that returns the data for the key, from the cached data returned by the
+        given row callback.
+
+        This allows a single callback to provide the data for multiple actions. The row callback is only
+        called once per index for all the actions.
+
+        :param get_row_data: The callback returning a dict of the data for each action key.
+        :type get_row_data: function
+        :param key: The key of the action data to return.
+        :type key: str
+
+        :return: The caching get_data callback.
+        :rtype: function
+        """
+
+        def cached_get_data(parent, index):
+            # Return a copy so that the cached data cannot be modified
+            return dict(self._get_data(get_row_data, parent, index)[key])
+
+        return cached_get_data
+
+    def _get_data(self, get_data, parent, index):
+        """
+        Get the cached data for the callback and index, or call the callback to get the data.
+
+        :param get_data: The get_data callback.
+        :type get_data: function
+        :param parent: The parent of the ViewItemDelegate which triggered the callback.
+        :type parent: QAbstractItemView
+        :param index: The index to get the data for.
+        :type index: QtCore.QModelIndex
+
+        :return: The cached data, which must not be modified.
+        :rtype: dict
+        """
+
+        # The internal id identifies the index parent, it is stable until the model layout changes
+        key = (index.row(), index.column(), index.internalId())
+        row_data = self._cache.get(key)
+        if row_data is None:
+            row_data = self._cache[key] = {}
+        data = row_data.get(get_data)
+        if data is None:
+            data = get_data(parent, index)
+            row_data[get_data] = data
+        return data
+
+    def _on_data_changed(self, top_left, bottom_right, roles=None):
+        """
+        Slot triggered when the model data has changed.
+
+        Clear the cached data for the changed rows and their parents, since the parent data may depend on
+        their children data (e.g. group items).
+
+        :param top_left: The top left index of the changed data.
+        :type top_left: QtCore.QModelIndex
+        :param bottom_right: The bottom right index of the changed data.
+        :type bottom_right: QtCore.QModelIndex
+        :param roles: The roles that changed.
+        :type roles: list<int>
+        """
+
+        internal_id = top_left.internalId()
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            for column in range(top_left.column(), bottom_right.column() + 1):
+                self._cache.pop((row, column, internal_id), None)
+
+        parent = top_left.parent()
+        while parent.isValid():
+            self._cache.pop((parent.row(), parent.column(), parent.internalId()), None)
+            parent = parent.parent()
+
+
+def _get_rule_manual_data(index, rule):
+    """
+    Get the data for displaying a manual rule.
+
+    :param index: The index the action is for.
+    :type index: :class:`sgtk.platform.qt.QtCore.QModelIndex`
+    :param rule: The rule for the index, or None for group items.
+    :type rule: ValidationRule
+
+    :return: The data for the action and index.
+    :rtype: dict
+    """
+
+    if not rule or not rule.manual:
+        return _INVISIBLE_ACTION_DATA
+
+    state = _CHECKED_ACTION_STATE if rule.manual_checked else _UNCHECKED_ACTION_STATE
+
+    return {
+        "visible": True,
+        "state": state,
+    }
+
+
+def _get_rule_optional_data(index, rule):
+    """
+    Get the data for displaying an optional rule.
+
+    :param index: The index the action is for.
+    :type index: :class:`sgtk.platform.qt.QtCore.QModelIndex`
+    :param rule: The rule for the index, or None for group items.
+    :type rule: ValidationRule
+
+    :return: The data for the action and index.
+    :rtype: dict
+    """
+
+    # Most rules are neither optional nor manual, check these first
+    if not rule or not rule.has_checkbox_slot:
+        return _INVISIBLE_ACTION_DATA
+
+    if not rule.optional:
+        # Ensure the manual checkboxes are aligned across rows
+        return _OPTIONAL_PLACEHOLDER_ACTION_DATA
+
+    checkbox_icon = index.data(ValidationRuleModel.CHECKBOX_ICON_ROLE)
+    state = _CHECKED_ACTION_STATE if rule.checked else _UNCHECKED_ACTION_STATE
+
+    return {
+        "visible": True,
+        "state": state,
+        "icon": checkbox_icon,
+    }
+
+
+def _get_rule_show_actions_data(index, rule):
+    """
+    Get the data for displaying and executing the rule action items.
+
+    :param index: The index the action is for.
+    :type index: :class:`sgtk.platform.qt.QtCore.QModelIndex`
+    :param rule: The rule for the index, or None for group items.
+    :type rule: ValidationRule
+
+    :return: The data for the action and index.
+    :rtype: dict
+    """
+
+    # Check the rule flag directly, the action data role builds the action kwargs
+    if not rule or not rule.has_actions:
+        return _INVISIBLE_ACTION_DATA
+
+    return {
+        "visible": True,
+    }
+
+
+def _get_rule_check_action_data(index, rule):
+    """
+    Get the data for displaying and executing the rule check action.
+
+    :param index: The index the action is for.
+    :type index: :class:`sgtk.platform.qt.QtCore.QModelIndex`
+    :param rule: The rule for the index, or None for group items.
+    :type rule: ValidationRule
+
+    :return: The data for the action and index.
+    :rtype: dict
+    """
+
+    if rule:
+        return {
+            "visible": rule.check_func is not None,
+            "name": None if rule.manual else rule.display_check_name,
+        }
+
+    # Group items aggregate the data from their child rules
+    name = index.data(ValidationRuleModel.RULE_CHECK_NAME_ROLE)
+    visible = bool(index.data(ValidationRuleModel.RULE_HAS_ITEMS_ROLE))
+
+    if name and index.data(ValidationRuleModel.RULE_VALIDATION_RAN):
+        # Modify the name to prepend "Re", e.g. Validate -> Revalidate
+        name = "Re{name}".format(name=name.lower())
+
+    return {
+        "visible": visible,
+        "name": name,
+    }
+
+
+def _get_rule_fix_action_data(index, rule):
+    """
+    Get the data for displaying and executing the rule fix action.
+
+    :param index: The index the action is for.
+    :type index: :class:`sgtk.platform.qt.QtCore.QModelIndex`
+    :param rule: The rule for the index, or None for group items.
+    :type rule: ValidationRule
+
+    :return: The data for the action and index.
+    :rtype: dict
+    """
+
+    if rule:
+        name = rule.fix_name
+        visible = rule.fix_func is not None
+    else:
+        # Group items aggregate the data from their child rules
+        name = index.data(ValidationRuleModel.RULE_FIX_NAME_ROLE)
+        visible = bool(index.data(ValidationRuleModel.RULE_HAS_ITEMS_ROLE))
+
+    return {
+        "visible": visible,
+        "name": name,
+    }
+
+
+def _get_index_rules(index):
+    """
+    Convenience method to get the rule, or the group rules, for the given index.
+
+    The data is read directly from the source model item, instead of mapping the index to the source model
+    for each role.
+
+    :param index: The rules view index to get the rules for.
+    :type index: QtGui.QModelIndex
+
+    :return: The rule for a rule index, or the list of rules for a group index.
+    :rtype: ValidationRule | list<ValidationRule>
+    """
+
+    src_index = _ensure_source_index(index)
+    model_item = src_index.model().itemFromIndex(src_index)
+    if not model_item:
+        return None
+
+    return model_item.data(ValidationRuleModel.RULE_ITEM_ROLE) or model_item.data(
+        ValidationRuleModel.RULE_ITEMS_ROLE
+    )
+
+
 def _ensure_source_index(index):
     """
     Convenience method to get the source index from the given index.
@@ -2171,8 +2859,13 @@ def _ensure_source_index(index):
     :rtype: QtGui.QModelIndex
     """
 
-    src_model = index.model()
-    if isinstance(src_model, QtGui.QSortFilterProxyModel):
-        return src_model.mapToSource(index)
+    model = index.model()
+    is_proxy = _IS_PROXY_MODEL_CACHE.get(model)
+    if is_proxy is None:
+        is_proxy = isinstance(model, QtGui.QSortFilterProxyModel)
+        _IS_PROXY_MODEL_CACHE[model] = is_proxy
+
+    if is_proxy:
+        return model.mapToSource(index)
 
     return index
@@ -0,0 +1,164 @@
+# Copyright (c) 2022 Autodesk, Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk, Inc.
+
+import os
+
+from mock import MagicMock
+
+from app_test_base import AppTestBase
+from tank_test.tank_test_base import setUpModule  # noqa
+
+
+class TestActionDataCache(AppTestBase):
+    """
+    Test the cache for the rules view delegate action data. Note that this test module is a
+    subclass of TankTestBase, which makes it a unittest.TestCase, which means we cannot use
+    some pytest functionality, like parametrization and pytest fixtures.
+    """
+
+    def setUp(self):
+        """
+        Set up before any tests are executed.
+        """
+
+        os.environ["TEST_ENVIRONMENT"] = "test"
+        super().setUp()
+
+        from sgtk.platform.qt import QtGui
+
+        app_module = self.app.import_module("tk_multi_data_validation")
+        action_data_cache_class = app_module.widgets.validation_widget._ActionDataCache
+
+        # Set up a model with a group item and its child items
+        self.model = QtGui.QStandardItemModel()
+        self.group_item = QtGui.QStandardItem("Group")
+        self.group_item.appendRows(
+            [QtGui.QStandardItem("Item #{}".format(i)) for i in range(3)]
+        )
+        self.model.invisibleRootItem().appendRow(self.group_item)
+
+        self.get_data = MagicMock(
+            side_effect=lambda parent, index: {"visible": True, "text": index.data()}
+        )
+        self.cache = action_data_cache_class(self.model)
+        self.cached_get_data = self.cache.wrap(self.get_data)
+
+    def get_all_data(self):
+        """
+        Get the cached data for the group item and all its child items.
+        """
+
+        group_index = self.group_item.index()
+        data = [self.cached_get_data(None, group_index)]
+        for row in range(self.group_item.rowCount()):
+            data.append(
+                self.cached_get_data(None, self.model.index(row, 0, group_index))
+            )
+        return data
+
+    def test_cached_data(self):
+        """
+        Test the data is only retrieved once for each index.
+        """
+
+        data = self.get_all_data()
+        assert self.get_data.call_count == 4
+        assert data[1] == {"visible": True, "text": "Item #0"}
+
+        assert self.get_all_data() == data
+        assert self.get_data.call_count == 4
+
+    def test_cached_data_copy(self):
+        """
+        Test modifying the returned data does not modify the cached data.
+        """
+
+        index = self.group_item.child(0).index()
+        self.cached_get_data(None, index)["visible"] = False
+
+        assert self.cached_get_data(None, index)["visible"] is True
+        assert self.get_data.call_count == 1
+
+    def test_data_changed(self):
+        """
+        Test the data is cleared for the changed row and its parent, but not its siblings.
+        """
+
+        self.get_all_data()
+        self.get_data.reset_mock()
+
+        self.group_item.child(1).setText("Changed")
+        data = self.get_all_data()
+
+        assert self.get_data.call_count == 2
+        called_indexes = [c.args[1] for c in self.get_data.call_args_list]
+        assert self.group_item.index() in called_indexes
+        assert self.group_item.child(1).index() in called_indexes
+        assert data[2]["text"] == "Changed"
+
+    def test_model_reset(self):
+        """
+        Test all the data is cleared when the model is reset.
+        """
+
+        self.get_all_data()
+        self.get_data.reset_mock()
+
+        self.model.beginResetModel()
+        self.model.endResetModel()
+        self.get_all_data()
+
+        assert self.get_data.call_count == 4
+
+    def test_rows_inserted(self):
+        """
+        Test all the data is cleared when rows are inserted.
+        """
+
+        from sgtk.platform.qt import QtGui
+
+        self.get_all_data()
+        self.get_data.reset_mock()
+
+        self.group_item.insertRow(0, QtGui.QStandardItem("Inserted"))
+        data = self.get_all_data()
+
+        assert self.get_data.call_count == 5
+        assert data[1]["text"] == "Inserted"
+
+    def test_rows_removed(self):
+        """
+        Test all the data is cleared when rows are removed.
+        """
+
+        self.get_all_data()
+        self.get_data.reset_mock()
+
+        self.group_item.removeRow(0)
+        data = self.get_all_data()
+
+        assert self.get_data.call_count == 3
+        assert data[1]["text"] == "Item #1"
+
+    def test_wrap_key(self):
+        """
+        Test the row data callback is called once for all the action keys.
+        """
+
+        get_row_data = MagicMock(
+            return_value={"check": {"visible": True}, "fix": {"visible": False}}
+        )
+        get_check_data = self.cache.wrap_key(get_row_data, "check")
+        get_fix_data = self.cache.wrap_key(get_row_data, "fix")
+
+        index = self.group_item.child(0).index()
+        assert get_check_data(None, index) == {"visible": True}
+        assert get_fix_data(None, index) == {"visible": False}
+        get_row_data.assert_called_once()
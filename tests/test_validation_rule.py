@@ -83,6 +83,7 @@ def test_validadtion_rule_init_defaults(bundle):
     assert rule.fix_name == "Fix"
     assert rule.fix_tooltip == "Click to fix this data violation."
     assert rule.actions == []
+    assert rule.has_actions is False
     assert rule.item_actions == []
     assert rule.dependencies == {}
     assert rule.data_type is None
@@ -91,6 +92,7 @@ def test_validadtion_rule_init_defaults(bundle):
     assert rule.checked is False
     assert rule.manual is True
     assert rule.manual_checked is False
+    assert rule.has_checkbox_slot is True
     assert rule.valid is None
     assert rule.errors == None
     assert rule.fix_executed is False
@@ -131,6 +133,7 @@ def test_validadtion_rule_init_with_data(bundle):
     assert rule.fix_tooltip == rule_data["fix_tooltip"]
     assert rule.data_type == rule_data["data_type"]
     assert rule.actions == rule_data["actions"]
+    assert rule.has_actions is True
     assert rule.item_actions == rule_data["item_actions"]
     assert rule.dependencies == rule_data["dependencies"]
     assert rule.get_kwargs == rule_data["get_kwargs"]
@@ -139,6 +142,7 @@ def test_validadtion_rule_init_with_data(bundle):
     assert rule.checked is False
     assert rule.manual is False
     assert rule.manual_checked is False
+    assert rule.has_checkbox_slot is False
     assert rule.valid is None
     assert rule.errors == None
     assert rule.fix_executed is False
@@ -210,6 +214,24 @@ def test_validadtion_rule_manual_property(bundle):
     assert non_manual_3.manual is False
 
 
+def test_validadtion_rule_has_checkbox_slot_property(bundle):
+    """Test the ValidationRule has checkbox slot property."""
+
+    optional_rule = ValidationRule(
+        {"id": "optional", "name": "Optional", "check_func": True, "required": False},
+        bundle=bundle,
+    )
+    assert optional_rule.has_checkbox_slot is True
+
+    required_rule = ValidationRule(
+        {"id": "required", "name": "Required", "check_func": True}, bundle=bundle
+    )
+    assert required_rule.has_checkbox_slot is False
+
+    manual_rule = ValidationRule({"id": "manual", "name": "Manual"}, bundle=bundle)
+    assert manual_rule.has_checkbox_slot is True
+
+
 def test_validadtion_rule_dependencies_property(bundle):
     """Test the ValidationRule dependencies property."""
 
@@ -229,6 +251,41 @@ def test_validadtion_rule_dependencies_property(bundle):
     rule.get_dependency_names() == rule_data["dependencies"].values()
 
 
+def test_validadtion_rule_display_check_name(bundle):
+    """Test the ValidationRule display check name property before and after executing the check."""
+
+    rule_data = {
+        "id": "rule",
+        "name": "Rule",
+        "check_func": MagicMock(return_value={"is_valid": True, "errors": []}),
+    }
+    rule = ValidationRule(rule_data, bundle=bundle)
+    assert rule.display_check_name == "Validate"
+
+    rule.exec_check()
+    assert rule.display_check_name == "Revalidate"
+    assert rule.display_check_name is rule.display_check_name
+
+    rule.reset()
+    assert rule.display_check_name == "Validate"
+
+
+def test_validadtion_rule_display_check_name_custom(bundle):
+    """Test the ValidationRule display check name property with a custom check name."""
+
+    rule_data = {
+        "id": "rule",
+        "name": "Rule",
+        "check_name": "Check Scene",
+        "check_func": MagicMock(return_value={"is_valid": False, "errors": None}),
+    }
+    rule = ValidationRule(rule_data, bundle=bundle)
+    assert rule.display_check_name == "Check Scene"
+
+    rule.exec_check()
+    assert rule.display_check_name == "Recheck scene"
+
+
 def test_validadtion_rule_exec_check_success(bundle):
     """Test the ValidationRule exec check function successfully executes."""
 
@@ -592,3 +649,26 @@ def test_validaiton_rule_process_check_result_with_object(bundle, result):
     # Now actually validate the data
     assert rule.valid == result.is_valid
     assert rule.errors == result.errors
+
+
+def test_validation_rule_get_actions_data_pre_validate(bundle):
+    """Test the ValidationRule get_actions_data function only runs the check function once."""
+
+    check_result = {"is_valid": False, "errors": [{"id": 1}, {"id": 2}]}
+    rule_data = {
+        "id": "rule",
+        "name": "Rule",
+        "check_func": MagicMock(return_value=check_result),
+        "actions": [
+            {"name": "Action 1", "callback": MagicMock()},
+            {"name": "Action 2", "callback": MagicMock()},
+            {"name": "Action 3", "callback": MagicMock()},
+        ],
+    }
+    rule = ValidationRule(rule_data, bundle=bundle)
+
+    actions = rule.get_actions_data(pre_validate=True)
+    rule_data["check_func"].assert_called_once()
+    assert len(actions) == 3
+    for action in actions:
+        assert action["kwargs"]["errors"] == check_result["errors"]